@@ -36,6 +36,22 @@ class AgentState(Enum):
     FINISHED = "finished"
 
 
+class ToolOutputChunk(str):
+    """Streamed tool result that also keeps the tool name and raw output.
+
+    It is the formatted text shown to users, so consumers that only handle
+    strings keep working, while others can use the structured fields directly.
+    """
+
+    __slots__ = ("tool_name", "output")
+
+    def __new__(cls, tool_name: str, output: str) -> "ToolOutputChunk":
+        chunk = super().__new__(cls, f"\n\n[Tool: {tool_name}]\n{output}\n")
+        chunk.tool_name = tool_name
+        chunk.output = output
+        return chunk
+
+
 class Agent(BaseModel):
     """Core agent class that orchestrates model calls and tool execution."""
 
@@ -441,7 +457,7 @@ class Agent(BaseModel):
                             executed_tool_cache[cache_key] = tool_result
 
                         # Execute tool
-                        yield f"\n\n[Tool: {tool_name}]\n{tool_result}\n"
+                        yield ToolOutputChunk(tool_name, tool_result)
 
                         # Add tool result to conversation history
                         tool_message = Message(
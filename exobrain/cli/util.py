@@ -21,8 +21,10 @@ def auto_register_tools(config: Config, tool_registry: ToolRegistry) -> None:
         config: Application configuration
         tool_registry: Tool registry to register tools into
     """
-    # Import tools package to trigger @register_tool decorators
-    import exobrain.tools  # noqa: F401
+    # Import tool modules to trigger @register_tool decorators
+    import exobrain.tools
+
+    exobrain.tools.register_all()
 
     # Track registered tools by category for logging
     registered_by_category: dict[str, list[str]] = {}
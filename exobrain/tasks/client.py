@@ -1,7 +1,6 @@
 """Task client for communicating with the task daemon."""
 
 import asyncio
-import json
 import os
 import platform
 import signal
@@ -12,16 +11,18 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from exobrain import __version__
+from exobrain.utils import fastjson
 
 from .models import Task, TaskStatus, TaskType
 from .transport import Transport, TransportFactory, TransportType
 
+_IS_WINDOWS = platform.system() == "Windows"
+_HAS_PROCFS = sys.platform.startswith("linux") and os.path.isdir("/proc/self")
 
-def _is_process_running(pid: int) -> bool:
-    """
-    Check if a process with the given PID is running.
 
-    Cross-platform implementation that works on Unix, Linux, macOS, and Windows.
+def _is_process_running_win(pid: int) -> bool:
+    """
+    Check if a process with the given PID is running on Windows.
 
     Args:
         pid: Process ID to check
@@ -29,79 +30,164 @@ def _is_process_running(pid: int) -> bool:
     Returns:
         True if process is running, False otherwise
     """
-    if platform.system() == "Windows":
-        # On Windows, use tasklist command or psutil-like approach
-        try:
-            import ctypes
-
-            # Try to open the process handle
-            PROCESS_QUERY_INFORMATION = 0x0400
-            handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_INFORMATION, False, pid)
-            if handle:
-                ctypes.windll.kernel32.CloseHandle(handle)
-                return True
+    try:
+        import ctypes
+
+        SYNCHRONIZE = 0x00100000
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        WAIT_TIMEOUT = 0x102
+
+        # Try to open the process handle
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(SYNCHRONIZE | PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
             return False
-        except (AttributeError, OSError):
-            # Fallback: try using tasklist
-            try:
-                result = subprocess.run(
-                    ["tasklist", "/FI", f"PID eq {pid}", "/NH"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                )
-                return str(pid) in result.stdout
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                return False
-    else:
-        # On Unix/Linux/macOS, use os.kill with signal 0
         try:
-            os.kill(pid, 0)
-            return True
-        except (ProcessLookupError, PermissionError):
+            # An opened handle may belong to a process that has already exited;
+            # a zero-timeout wait only times out while it is still alive
+            return kernel32.WaitForSingleObject(handle, 0) == WAIT_TIMEOUT
+        finally:
+            kernel32.CloseHandle(handle)
+    except (AttributeError, OSError):
+        # Fallback: try using tasklist
+        try:
+            result = subprocess.run(
+                ["tasklist", "/FI", f"PID eq {pid}", "/NH"],
+                capture_output=True,
+                text=True,
+                timeout=2,
+            )
+            return str(pid) in result.stdout
+        except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
 
 
-def _terminate_process(pid: int, force: bool = False) -> None:
+def _read_proc_stat(pid: int) -> Optional[List[str]]:
+    """
+    Read the fields of /proc/<pid>/stat on Linux.
+
+    Args:
+        pid: Process ID to inspect
+
+    Returns:
+        Fields following the parenthesized command name (state is field 0,
+        start time is field 19), or None if the process does not exist
+    """
+    try:
+        fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        data = os.read(fd, 4096)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+    # The command name may contain spaces and parentheses, so split after the last ')'
+    return data[data.rfind(b")") + 1 :].decode("ascii", errors="replace").split()
+
+
+def _is_process_running_posix(pid: int) -> bool:
+    """
+    Check if a process with the given PID is running on Unix/Linux/macOS.
+
+    Args:
+        pid: Process ID to check
+
+    Returns:
+        True if process is running, False otherwise
+    """
+    if _HAS_PROCFS:
+        # One small read answers both existence and zombie state
+        fields = _read_proc_stat(pid)
+        return bool(fields) and fields[0] not in ("Z", "X")
+
+    # Signal 0 performs error checking only
+    try:
+        os.kill(pid, 0)
+        return True
+    except (ProcessLookupError, PermissionError):
+        return False
+
+
+def _terminate_process_win(pid: int, force: bool = False) -> None:
     """
-    Terminate a process with the given PID.
+    Terminate a process with the given PID on Windows.
 
-    Cross-platform implementation that works on Unix, Linux, macOS, and Windows.
+    Args:
+        pid: Process ID to terminate
+        force: If True, force kill the process
+
+    Raises:
+        ProcessLookupError: If process doesn't exist
+    """
+    try:
+        import ctypes
+
+        PROCESS_TERMINATE = 0x0001
+        handle = ctypes.windll.kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
+        if not handle:
+            raise ProcessLookupError(f"Process {pid} not found")
+
+        # TerminateProcess with exit code 1
+        success = ctypes.windll.kernel32.TerminateProcess(handle, 1)
+        ctypes.windll.kernel32.CloseHandle(handle)
+
+        if not success:
+            raise OSError(f"Failed to terminate process {pid}")
+    except (AttributeError, OSError) as e:
+        # Fallback: try using taskkill
+        try:
+            cmd = ["taskkill", "/F" if force else "/T", "/PID", str(pid)]
+            subprocess.run(cmd, check=True, capture_output=True, timeout=5)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+            raise ProcessLookupError(f"Failed to terminate process {pid}") from e
+
+
+def _terminate_process_posix(pid: int, force: bool = False) -> None:
+    """
+    Terminate a process with the given PID on Unix/Linux/macOS.
 
     Args:
         pid: Process ID to terminate
-        force: If True, force kill the process (SIGKILL on Unix, TerminateProcess on Windows)
+        force: If True, send SIGKILL instead of SIGTERM
 
     Raises:
         ProcessLookupError: If process doesn't exist
         PermissionError: If insufficient permissions
     """
-    if platform.system() == "Windows":
-        try:
-            import ctypes
+    os.kill(pid, signal.SIGKILL if force else signal.SIGTERM)
 
-            PROCESS_TERMINATE = 0x0001
-            handle = ctypes.windll.kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
-            if not handle:
-                raise ProcessLookupError(f"Process {pid} not found")
 
-            # TerminateProcess with exit code 1
-            success = ctypes.windll.kernel32.TerminateProcess(handle, 1)
-            ctypes.windll.kernel32.CloseHandle(handle)
+# Resolve platform-specific helpers once at import time so that polling loops
+# (stop_daemon, get_daemon_status) don't pay for platform detection per probe.
+_is_process_running = _is_process_running_win if _IS_WINDOWS else _is_process_running_posix
+_terminate_process = _terminate_process_win if _IS_WINDOWS else _terminate_process_posix
 
-            if not success:
-                raise OSError(f"Failed to terminate process {pid}")
-        except (AttributeError, OSError) as e:
-            # Fallback: try using taskkill
-            try:
-                cmd = ["taskkill", "/F" if force else "/T", "/PID", str(pid)]
-                subprocess.run(cmd, check=True, capture_output=True, timeout=5)
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-                raise ProcessLookupError(f"Failed to terminate process {pid}") from e
-    else:
-        # On Unix/Linux/macOS, use os.kill with appropriate signal
-        sig = signal.SIGKILL if force else signal.SIGTERM
-        os.kill(pid, sig)
+
+def _parse_pid_data(content: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse daemon PID file content.
+
+    Args:
+        content: PID file content, either a JSON object or a bare PID (old format)
+
+    Returns:
+        Dictionary with 'pid' and 'version' keys, or None if content is invalid
+    """
+    content = content.strip()
+    try:
+        # New format is a JSON object, old format is just the PID number
+        if content.startswith("{"):
+            data = fastjson.loads(content)
+            if isinstance(data, dict) and "pid" in data:
+                return data
+            return None
+        return {"pid": int(content), "version": None}
+    except ValueError:
+        # JSON decode errors of both json and orjson subclass ValueError
+        return None
 
 
 class DaemonNotRunningError(Exception):
@@ -166,10 +252,22 @@ class TaskClient:
                     "Task daemon is not running. Start it with: exobrain task daemon start"
                 )
 
-        # Check version compatibility
-        await self._check_version_compatibility()
+        await self._open_transport()
 
-        # Create transport
+        # Check version compatibility over the freshly opened transport
+        try:
+            await self._check_version_compatibility()
+        except BaseException:
+            await self.disconnect()
+            raise
+
+    async def _open_transport(self) -> None:
+        """
+        Create the transport and connect it, retrying on failure.
+
+        Raises:
+            DaemonConnectionError: If connection fails after retries
+        """
         self._transport = TransportFactory.create_transport(
             self.transport_type, self.transport_config
         )
@@ -185,6 +283,7 @@ class TaskClient:
                 if attempt < self.max_retries - 1:
                     await asyncio.sleep(self.retry_delay)
 
+        self._transport = None
         raise DaemonConnectionError(
             f"Failed to connect to daemon after {self.max_retries} attempts: {last_error}"
         )
@@ -193,64 +292,62 @@ class TaskClient:
         """
         Check if daemon version matches client version.
 
+        Uses a single ``hello`` handshake on the connected transport, which reports
+        the daemon version together with its number of active tasks.
+
         If versions don't match:
-        - If no running tasks: automatically restart daemon
+        - If no running tasks: automatically restart daemon and reconnect
         - If running tasks exist: raise DaemonVersionMismatchError
 
         Raises:
             DaemonVersionMismatchError: If version mismatch and running tasks exist
         """
-        daemon_version = self.get_daemon_version()
+        try:
+            response = await self._transport.send_request({"action": "hello", "params": {}})
 
-        # If daemon version is None (old format PID file), skip check
-        if daemon_version is None:
-            return
+            if response.get("status") == "ok":
+                data = response.get("data", {})
+                daemon_version = data.get("version")
+                running_count = data.get("running_task_count", 0)
+            else:
+                # Daemon predates the hello handshake - fall back to PID file and list_tasks
+                daemon_version = self.get_daemon_version()
+                if daemon_version is None or daemon_version == __version__:
+                    return
+                request = {"action": "list_tasks", "params": {"status": "running"}}
+                response = await self._transport.send_request(request)
+                running_count = len(response.get("data", {}).get("tasks", []))
 
-        # Check if versions match
-        if daemon_version == __version__:
-            return
+            # Check if versions match
+            if daemon_version is None or daemon_version == __version__:
+                return
 
-        # Versions don't match - check for running tasks
-        try:
-            # Create temporary transport to check tasks
-            temp_transport = TransportFactory.create_transport(
-                self.transport_type, self.transport_config
-            )
-            await temp_transport.connect()
+            if running_count:
+                # Has running tasks - cannot auto-restart
+                raise DaemonVersionMismatchError(
+                    f"Daemon version mismatch: daemon={daemon_version}, client={__version__}. "
+                    f"There are {running_count} running task(s). "
+                    f"Please wait for tasks to complete or cancel them, then restart the daemon manually with: "
+                    f"exobrain task daemon restart"
+                )
+
+            # No running tasks - safe to restart
+            await self.disconnect()
 
+            print(
+                f"Daemon version mismatch detected (daemon={daemon_version}, client={__version__}). "
+                f"No running tasks found. Restarting daemon..."
+            )
             try:
-                # Check for running tasks
-                request = {"action": "list_tasks", "params": {"status": "running"}}
-                response = await temp_transport.send_request(request)
-
-                if response.get("status") == "ok":
-                    running_tasks = response.get("data", {}).get("tasks", [])
-
-                    if running_tasks:
-                        # Has running tasks - cannot auto-restart
-                        raise DaemonVersionMismatchError(
-                            f"Daemon version mismatch: daemon={daemon_version}, client={__version__}. "
-                            f"There are {len(running_tasks)} running task(s). "
-                            f"Please wait for tasks to complete or cancel them, then restart the daemon manually with: "
-                            f"exobrain task daemon restart"
-                        )
-
-                # No running tasks - safe to restart
-                await temp_transport.disconnect()
-
-                # Restart daemon
-                print(
-                    f"Daemon version mismatch detected (daemon={daemon_version}, client={__version__}). "
-                    f"No running tasks found. Restarting daemon..."
-                )
                 await self.restart_daemon(timeout=10.0)
                 print("Daemon restarted successfully.")
-
             finally:
-                await temp_transport.disconnect()
+                # Reconnect even if the restart failed, so connect() never returns
+                # without a transport; a failed reconnect raises DaemonConnectionError
+                await self._open_transport()
 
-        except DaemonVersionMismatchError:
-            # Re-raise version mismatch errors
+        except (DaemonVersionMismatchError, DaemonConnectionError):
+            # Re-raise version mismatch and reconnection errors
             raise
         except Exception as e:
             # If we can't check, log warning and continue
@@ -293,11 +390,10 @@ class TaskClient:
             return True
         else:
             # Process is dead - clean up stale PID file
-            if self.pid_file.exists():
-                try:
-                    self.pid_file.unlink()
-                except Exception:
-                    pass
+            try:
+                self.pid_file.unlink(missing_ok=True)
+            except OSError:
+                pass
             return False
 
     def get_daemon_pid(self) -> Optional[int]:
@@ -327,31 +423,15 @@ class TaskClient:
         Returns:
             Dictionary with 'pid' and 'version' keys, or None if file doesn't exist or is invalid
         """
-        if not self.pid_file.exists():
-            return None
-
         try:
             with open(self.pid_file, "r") as f:
-                content = f.read().strip()
-
-                # Try to parse as JSON (new format)
-                try:
-                    data = json.loads(content)
-                    if isinstance(data, dict) and "pid" in data:
-                        return data
-                except json.JSONDecodeError:
-                    pass
-
-                # Fall back to old format (just PID number)
-                try:
-                    pid = int(content)
-                    return {"pid": pid, "version": None}
-                except ValueError:
-                    return None
-
-        except (IOError, OSError):
+                content = f.read()
+        except OSError:
+            # Includes FileNotFoundError when no daemon has written the file
             return None
 
+        return _parse_pid_data(content)
+
     async def start_daemon(self, wait: bool = True, timeout: float = 5.0) -> int:
         """
         Start the daemon process.
@@ -392,18 +472,46 @@ class TaskClient:
         # Add PID file
         cmd.extend(["--pid-file", str(self.pid_file)])
 
-        # Start daemon as background process
-        subprocess.Popen(
-            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True
-        )
+        # On POSIX, hand the daemon the write end of a pipe to signal readiness on
+        ready_r = ready_w = None
+        popen_kwargs: Dict[str, Any] = {}
+        if wait and not _IS_WINDOWS:
+            ready_r, ready_w = os.pipe()
+            cmd.extend(["--ready-fd", str(ready_w)])
+            popen_kwargs["pass_fds"] = (ready_w,)
+
+        # Start daemon as background process (process creation can block on Windows)
+        try:
+            await asyncio.to_thread(
+                subprocess.Popen,
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+                **popen_kwargs,
+            )
+        except BaseException:
+            if ready_r is not None:
+                os.close(ready_r)
+            raise
+        finally:
+            if ready_w is not None:
+                os.close(ready_w)
 
         # Wait for daemon to be ready
         if wait:
             start_time = time.time()
+
+            if ready_r is not None:
+                try:
+                    await self._wait_for_ready_signal(ready_r, timeout)
+                finally:
+                    os.close(ready_r)
+
             while time.time() - start_time < timeout:
+                # The daemon writes its PID file only once the server is listening,
+                # so a live PID means it is ready to accept connections
                 if self.is_daemon_running():
-                    # Give it a moment to fully initialize
-                    await asyncio.sleep(0.2)
                     return self.get_daemon_pid()
                 await asyncio.sleep(0.1)
 
@@ -411,6 +519,32 @@ class TaskClient:
 
         return None
 
+    @staticmethod
+    async def _wait_for_ready_signal(fd: int, timeout: float) -> None:
+        """
+        Wait until the daemon writes to (or closes) its readiness pipe.
+
+        Returns without error on timeout; callers fall back to polling the PID file.
+
+        Args:
+            fd: Read end of the readiness pipe
+            timeout: Maximum time to wait in seconds
+        """
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+
+        def on_readable() -> None:
+            if not ready.done():
+                ready.set_result(None)
+
+        loop.add_reader(fd, on_readable)
+        try:
+            await asyncio.wait_for(ready, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            loop.remove_reader(fd)
+
     async def stop_daemon(self, timeout: float = 5.0) -> bool:
         """
         Stop the daemon process.
@@ -430,7 +564,7 @@ class TaskClient:
 
         try:
             # Send termination signal (cross-platform)
-            _terminate_process(pid, force=False)
+            await asyncio.to_thread(_terminate_process, pid, force=False)
 
             # Wait for daemon to stop
             start_time = time.time()
@@ -440,7 +574,7 @@ class TaskClient:
                 await asyncio.sleep(0.1)
 
             # Force kill if still running
-            _terminate_process(pid, force=True)
+            await asyncio.to_thread(_terminate_process, pid, force=True)
             await asyncio.sleep(0.1)
 
             if self.is_daemon_running():
@@ -487,10 +621,16 @@ class TaskClient:
 
         if running:
             try:
-                # Try to ping daemon
-                async with self:
+                # Try to ping daemon, reusing the current connection if there is one
+                if self._transport is not None and self._transport.is_connected():
                     response = await self.ping()
-                    status["responsive"] = response.get("status") == "ok"
+                else:
+                    await self.connect()
+                    try:
+                        response = await self.ping()
+                    finally:
+                        await self.disconnect()
+                status["responsive"] = response.get("status") == "ok"
             except Exception as e:
                 status["responsive"] = False
                 status["error"] = str(e)
@@ -514,18 +654,39 @@ class TaskClient:
             DaemonConnectionError: If not connected
             RuntimeError: If request fails
         """
-        if not self._transport or not self._transport.is_connected():
+        if self._transport is None:
             raise DaemonConnectionError("Not connected to daemon")
 
         request = {"action": action, "params": params or {}}
 
-        response = await self._transport.send_request(request)
+        # Optimistically send; transports raise ConnectionError when disconnected
+        try:
+            response = await self._transport.send_request(request)
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            raise DaemonConnectionError(f"Not connected to daemon: {e}") from e
 
         if response.get("status") == "error":
             raise RuntimeError(response.get("error", "Unknown error"))
 
         return response
 
+    async def batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send several requests to the daemon in a single round-trip.
+
+        Args:
+            requests: Request dictionaries with 'action' and 'params' keys
+
+        Returns:
+            Response dictionaries, in the same order as requests. Failures of
+            individual requests are reported in their own response, not raised.
+        """
+        if not requests:
+            return []
+
+        response = await self._send_request("batch", {"requests": requests})
+        return response["data"]["results"]
+
     async def ping(self) -> Dict[str, Any]:
         """
         Ping the daemon.
@@ -578,6 +739,27 @@ class TaskClient:
         response = await self._send_request("get_task", params)
         return Task.from_dict(response["data"]["task"])
 
+    async def get_tasks(self, task_ids: List[str]) -> List[Task]:
+        """
+        Get several tasks by ID in a single round-trip.
+
+        Args:
+            task_ids: Task IDs
+
+        Returns:
+            Task objects, in the same order as task_ids
+
+        Raises:
+            RuntimeError: If any of the tasks cannot be retrieved
+        """
+        requests = [{"action": "get_task", "params": {"task_id": task_id}} for task_id in task_ids]
+        tasks = []
+        for response in await self.batch(requests):
+            if response.get("status") == "error":
+                raise RuntimeError(response.get("error", "Unknown error"))
+            tasks.append(Task.from_dict(response["data"]["task"]))
+        return tasks
+
     async def list_tasks(
         self,
         status: Optional[TaskStatus] = None,
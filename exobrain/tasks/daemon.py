@@ -1,18 +1,19 @@
 """Task daemon process."""
 
 import asyncio
-import json
+import copy
 import logging
 import os
-import platform
 import signal
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from exobrain import __version__
+from exobrain.utils import fastjson
 
+from .client import _IS_WINDOWS, _is_process_running, _parse_pid_data
 from .manager import TaskManager
-from .models import TaskStatus, TaskType
+from .models import _TASK_STATUS_MAP, _TASK_TYPE_MAP, TaskType
 from .monitor import TaskMonitor
 from .storage import TaskStorage
 from .transport import TransportFactory, TransportServer, TransportType
@@ -20,55 +21,86 @@ from .transport import TransportFactory, TransportServer, TransportType
 logger = logging.getLogger(__name__)
 
 
-def _is_process_running(pid: int) -> bool:
+# PID file path -> ((st_ino, st_size, st_mtime_ns), pid)
+_PID_CACHE: Dict[str, Tuple[Tuple[int, int, int], int]] = {}
+
+
+def _read_pid(pid_file_path: Path) -> Optional[int]:
     """
-    Check if a process with the given PID is running.
+    Read the daemon PID from a PID file.
 
-    Cross-platform implementation that works on Unix, Linux, macOS, and Windows.
+    The parsed PID is cached per path and reused while the file is unchanged,
+    so repeated probes cost a single stat instead of open, read and parse.
 
     Args:
-        pid: Process ID to check
+        pid_file_path: Path to PID file
 
     Returns:
-        True if process is running, False otherwise
+        PID, or None if the file doesn't exist or is invalid
     """
-    if platform.system() == "Windows":
-        # On Windows, use tasklist command or psutil-like approach
+    key = str(pid_file_path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        _PID_CACHE.pop(key, None)
+        return None
+
+    signature = (st.st_ino, st.st_size, st.st_mtime_ns)
+    cached = _PID_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        fd = os.open(key, os.O_RDONLY)
         try:
-            import ctypes
-            import subprocess
-
-            # Try to open the process handle
-            PROCESS_QUERY_INFORMATION = 0x0400
-            handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_INFORMATION, False, pid)
-            if handle:
-                ctypes.windll.kernel32.CloseHandle(handle)
-                return True
-            return False
-        except (AttributeError, OSError):
-            # Fallback: try using tasklist
-            try:
-                result = subprocess.run(
-                    ["tasklist", "/FI", f"PID eq {pid}", "/NH"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                )
-                return str(pid) in result.stdout
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                return False
-    else:
-        # On Unix/Linux/macOS, use os.kill with signal 0
-        try:
-            os.kill(pid, 0)
-            return True
-        except (ProcessLookupError, PermissionError):
-            return False
+            content = os.read(fd, max(st.st_size, 64))
+        finally:
+            os.close(fd)
+        pid_data = _parse_pid_data(content.decode("utf-8", errors="replace"))
+    except OSError:
+        pid_data = None
+
+    pid = pid_data.get("pid") if pid_data else None
+    if not isinstance(pid, int):
+        _PID_CACHE.pop(key, None)
+        return None
+
+    _PID_CACHE[key] = (signature, pid)
+    return pid
+
+
+def _preload_agent_modules() -> None:
+    """Import the modules agent tasks need, moving their import cost off the first task."""
+    try:
+        import exobrain.cli.util  # noqa: F401
+        import exobrain.config  # noqa: F401
+    except Exception as e:
+        logger.warning(f"Failed to preload agent modules: {e}")
 
 
 class TaskDaemon:
     """Task daemon process that manages background tasks."""
 
+    # Request action -> handler method name
+    _HANDLERS: Dict[str, str] = {
+        "create_task": "_handle_create_task",
+        "get_task": "_handle_get_task",
+        "list_tasks": "_handle_list_tasks",
+        "cancel_task": "_handle_cancel_task",
+        "delete_task": "_handle_delete_task",
+        "get_output": "_handle_get_output",
+        "get_metrics": "_handle_get_metrics",
+        "get_health": "_handle_get_health",
+        "get_statistics": "_handle_get_statistics",
+        "cleanup_tasks": "_handle_cleanup_tasks",
+        "get_version": "_handle_get_version",
+        "hello": "_handle_hello",
+        "batch": "_handle_batch",
+    }
+
+    # Read-only actions whose concurrent identical requests share one computation
+    _COALESCED_ACTIONS = frozenset({"list_tasks", "get_metrics", "get_health", "get_statistics"})
+
     def __init__(
         self,
         storage_path: str = "~/.exobrain/data/tasks",
@@ -80,6 +112,7 @@ class TaskDaemon:
         cleanup_retention_days: int = 30,
         cleanup_max_tasks: int = 1000,
         cleanup_interval_hours: int = 24,
+        ready_fd: Optional[int] = None,
     ):
         """
         Initialize task daemon.
@@ -94,6 +127,7 @@ class TaskDaemon:
             cleanup_retention_days: Delete tasks older than this many days
             cleanup_max_tasks: Keep at most this many tasks
             cleanup_interval_hours: Run cleanup every N hours
+            ready_fd: Optional file descriptor to write a byte to once the daemon is ready
         """
         self.storage = TaskStorage(storage_path)
         self.transport_type = transport_type
@@ -104,16 +138,28 @@ class TaskDaemon:
         self.cleanup_retention_days = cleanup_retention_days
         self.cleanup_max_tasks = cleanup_max_tasks
         self.cleanup_interval_hours = cleanup_interval_hours
+        self.ready_fd = ready_fd
 
         self._server: Optional[TransportServer] = None
         self._running = False
         self._manager: Optional[TaskManager] = None
         self._monitor: Optional[TaskMonitor] = None
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event = asyncio.Event()
+        self._shutdown_complete: Optional[asyncio.Future] = None
+        self._shutdown_task: Optional[asyncio.Task] = None
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._signals: List[int] = []
+        # Manual and automatic cleanups must not run over each other
+        self._cleanup_lock = asyncio.Lock()
 
     async def start(self) -> None:
         """Start the daemon."""
         logger.info("Starting task daemon")
+        self._loop = asyncio.get_running_loop()
+        self._stop_event.clear()
+        self._shutdown_complete = self._loop.create_future()
 
         # Initialize storage
         logger.info("Initializing storage")
@@ -139,7 +185,8 @@ class TaskDaemon:
         logger.info("Starting transport server")
         await self._server.start()
 
-        # Write PID file
+        # Write PID file only after the server is listening; clients treat its
+        # presence as the readiness signal
         self._write_pid_file()
 
         # Set up signal handlers
@@ -152,6 +199,12 @@ class TaskDaemon:
 
         self._running = True
 
+        # Notify the launching client that we are ready
+        self._signal_ready()
+
+        # Warm agent imports in the background so startup isn't delayed by them
+        self._loop.run_in_executor(None, _preload_agent_modules)
+
         logger.info(f"Task daemon started (PID: {os.getpid()})")
         print(f"Task daemon started (PID: {os.getpid()})")
         print(f"Transport: {self.transport_type.value}")
@@ -160,43 +213,51 @@ class TaskDaemon:
 
     async def stop(self) -> None:
         """Stop the daemon."""
+        # A shutdown is already under way (e.g. started by a signal), wait for it
+        if self._stop_event.is_set() and self._shutdown_complete is not None:
+            await asyncio.shield(self._shutdown_complete)
+            return
+
         self._running = False
+        self._stop_event.set()
+        self._remove_signal_handlers()
 
-        # Cancel cleanup task
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
+        try:
+            # Cleanup loop exits on its own once the stop event is set
+            if self._cleanup_task:
                 await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
-            self._cleanup_task = None
+                self._cleanup_task = None
+
+            # Shutdown task manager
+            if self._manager:
+                await self._manager.shutdown()
+                self._manager = None
 
-        # Shutdown task manager
-        if self._manager:
-            await self._manager.shutdown()
-            self._manager = None
+            # Stop server
+            if self._server:
+                await self._server.stop()
+                self._server = None
 
-        # Stop server
-        if self._server:
-            await self._server.stop()
-            self._server = None
+            # Write index changes still waiting for their delayed flush
+            await self.storage.flush()
 
-        # Remove PID file
-        self._remove_pid_file()
+            # Remove PID file
+            self._remove_pid_file()
 
-        print("Task daemon stopped")
+            print("Task daemon stopped")
+
+        finally:
+            if self._shutdown_complete is not None and not self._shutdown_complete.done():
+                self._shutdown_complete.set_result(None)
 
     async def run(self) -> None:
-        """Run the daemon main loop."""
+        """Run the daemon until it has been shut down by a signal or stop()."""
         try:
-            # Keep daemon running
-            while self._running:
-                await asyncio.sleep(1)
-
-        except KeyboardInterrupt:
-            print("\nReceived interrupt signal")
+            await asyncio.shield(self._shutdown_complete)
         finally:
-            await self.stop()
+            # Still shut down cleanly if the caller cancels run()
+            if not self._shutdown_complete.done():
+                await self.stop()
 
     async def _handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -215,34 +276,20 @@ class TaskDaemon:
         if not action:
             return {"status": "error", "error": "Missing 'action' field in request"}
 
+        # Fast path for liveness checks
+        if action == "ping":
+            return {"status": "ok", "data": {"message": "pong"}}
+
         try:
-            if action == "create_task":
-                return await self._handle_create_task(params)
-            elif action == "get_task":
-                return await self._handle_get_task(params)
-            elif action == "list_tasks":
-                return await self._handle_list_tasks(params)
-            elif action == "cancel_task":
-                return await self._handle_cancel_task(params)
-            elif action == "delete_task":
-                return await self._handle_delete_task(params)
-            elif action == "get_output":
-                return await self._handle_get_output(params)
-            elif action == "get_metrics":
-                return await self._handle_get_metrics(params)
-            elif action == "get_health":
-                return await self._handle_get_health(params)
-            elif action == "get_statistics":
-                return await self._handle_get_statistics(params)
-            elif action == "cleanup_tasks":
-                return await self._handle_cleanup_tasks(params)
-            elif action == "get_version":
-                return {"status": "ok", "data": {"version": __version__}}
-            elif action == "ping":
-                return {"status": "ok", "data": {"message": "pong"}}
-            else:
+            method_name = self._HANDLERS.get(action)
+            if method_name is None:
                 return {"status": "error", "error": f"Unknown action: {action}"}
 
+            if action in self._COALESCED_ACTIONS:
+                return await self._handle_coalesced(action, method_name, params)
+
+            return await getattr(self, method_name)(params)
+
         except KeyError as e:
             return {"status": "error", "error": f"Missing required parameter: {str(e)}"}
         except ValueError as e:
@@ -250,6 +297,113 @@ class TaskDaemon:
         except Exception as e:
             return {"status": "error", "error": f"Internal error: {str(e)}"}
 
+    async def _handle_coalesced(
+        self, action: str, method_name: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Run a read-only handler, sharing the result with identical in-flight requests.
+
+        Each caller gets its own copy of the response. If the request running the
+        handler is cancelled, waiting requests run the handler themselves.
+
+        Args:
+            action: Request action
+            method_name: Name of the handler method
+            params: Request parameters
+
+        Returns:
+            Response dictionary
+        """
+        key = (action, repr(sorted(params.items())))
+
+        future = self._inflight.get(key)
+        while future is not None:
+            # Shield so that a cancelled follower doesn't cancel the shared computation
+            result = await asyncio.shield(future)
+            if result is not None:
+                return copy.deepcopy(result)
+            # The leader was cancelled; retry, joining any new leader
+            future = self._inflight.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await getattr(self, method_name)(params)
+        except asyncio.CancelledError:
+            # Wake followers with None so they retry instead of being cancelled
+            future.set_result(None)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark as retrieved in case nobody else was waiting on it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    async def _handle_get_version(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle get_version request.
+
+        Args:
+            params: Request parameters
+
+        Returns:
+            Response dictionary
+        """
+        return {"status": "ok", "data": {"version": __version__}}
+
+    async def _handle_hello(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle hello handshake request.
+
+        Reports everything a client needs right after connecting in one round-trip.
+
+        Args:
+            params: Request parameters
+
+        Returns:
+            Response dictionary
+        """
+        running_count = self._manager.active_task_count if self._manager else 0
+
+        return {
+            "status": "ok",
+            "data": {"version": __version__, "running_task_count": running_count},
+        }
+
+    async def _handle_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle batch request.
+
+        Runs each sub-request in order and returns all responses in one round-trip.
+
+        Args:
+            params: Request parameters with a 'requests' list
+
+        Returns:
+            Response dictionary
+        """
+        requests = params["requests"]
+        if not isinstance(requests, list):
+            raise ValueError("'requests' must be a list")
+
+        results = []
+        for sub_request in requests:
+            if not isinstance(sub_request, dict):
+                results.append({"status": "error", "error": "Batch entry must be an object"})
+            elif sub_request.get("action") == "batch":
+                results.append(
+                    {"status": "error", "error": "Nested batch requests are not allowed"}
+                )
+            else:
+                results.append(await self._handle_request(sub_request))
+
+        return {"status": "ok", "data": {"results": results}}
+
     async def _handle_create_task(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle create_task request.
@@ -262,11 +416,16 @@ class TaskDaemon:
         """
         logger.info(f"Handling create_task request: params={params}")
 
+        task_type_value = params.get("task_type", TaskType.AGENT.value)
+        task_type = _TASK_TYPE_MAP.get(task_type_value)
+        if task_type is None:
+            return {"status": "error", "error": f"Invalid task_type: {task_type_value}"}
+
         # Create task using manager
         task = await self._manager.create_task(
             name=params.get("name", ""),
             description=params.get("description", ""),
-            task_type=TaskType(params.get("task_type", TaskType.AGENT.value)),
+            task_type=task_type,
             config=params.get("config", {}),
         )
 
@@ -308,16 +467,28 @@ class TaskDaemon:
         """
         status = params.get("status")
         if status:
-            status = TaskStatus(status)
+            status_value = status
+            status = _TASK_STATUS_MAP.get(status_value)
+            if status is None:
+                return {"status": "error", "error": f"Invalid status: {status_value}"}
 
         task_type = params.get("task_type")
+        if task_type:
+            task_type_value = task_type
+            task_type = _TASK_TYPE_MAP.get(task_type_value)
+            if task_type is None:
+                return {"status": "error", "error": f"Invalid task_type: {task_type_value}"}
+
         limit = params.get("limit")
 
-        tasks = await self._manager.list_tasks(status, task_type, limit)
+        # Serialize each task as it is loaded so Task objects are not all held at once
+        task_dicts = [
+            task.to_dict() async for task in self._manager.iter_tasks(status, task_type, limit)
+        ]
 
         return {
             "status": "ok",
-            "data": {"tasks": [task.to_dict() for task in tasks], "count": len(tasks)},
+            "data": {"tasks": task_dicts, "count": len(task_dicts)},
         }
 
     async def _handle_cancel_task(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -334,15 +505,12 @@ class TaskDaemon:
         if not task_id:
             return {"status": "error", "error": "Missing task_id"}
 
-        # Cancel task using manager
-        cancelled = await self._manager.cancel_task(task_id)
+        # Cancel task using manager, which returns the updated task
+        task = await self._manager.cancel_task(task_id)
 
-        if not cancelled:
+        if task is None:
             return {"status": "error", "error": f"Task not found or not active: {task_id}"}
 
-        # Get updated task
-        task = await self._manager.get_task(task_id)
-
         return {"status": "ok", "data": {"task": task.to_dict()}}
 
     async def _handle_delete_task(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -451,10 +619,11 @@ class TaskDaemon:
         retention_days = params.get("retention_days", self.cleanup_retention_days)
         max_tasks = params.get("max_tasks", self.cleanup_max_tasks)
 
-        deleted_count = await self.storage.cleanup_old_tasks(
-            retention_days=retention_days,
-            max_tasks=max_tasks,
-        )
+        async with self._cleanup_lock:
+            deleted_count = await self.storage.cleanup_old_tasks(
+                retention_days=retention_days,
+                max_tasks=max_tasks,
+            )
 
         return {
             "status": "ok",
@@ -469,24 +638,25 @@ class TaskDaemon:
         """Run periodic cleanup of old tasks."""
         logger.info("Starting cleanup loop")
 
-        while self._running:
+        while not self._stop_event.is_set():
             try:
-                # Wait for cleanup interval
-                await asyncio.sleep(self.cleanup_interval_hours * 3600)
-
-                if not self._running:
-                    break
+                # Wait for cleanup interval, returning early if the daemon is stopping
+                await asyncio.wait_for(
+                    self._stop_event.wait(), timeout=self.cleanup_interval_hours * 3600
+                )
+                break
+            except asyncio.TimeoutError:
+                pass
 
+            try:
                 logger.info("Running automatic cleanup")
-                deleted_count = await self.storage.cleanup_old_tasks(
-                    retention_days=self.cleanup_retention_days,
-                    max_tasks=self.cleanup_max_tasks,
-                )
+                async with self._cleanup_lock:
+                    deleted_count = await self.storage.cleanup_old_tasks(
+                        retention_days=self.cleanup_retention_days,
+                        max_tasks=self.cleanup_max_tasks,
+                    )
                 logger.info(f"Cleanup complete: deleted {deleted_count} tasks")
 
-            except asyncio.CancelledError:
-                logger.info("Cleanup loop cancelled")
-                break
             except Exception as e:
                 logger.error(f"Error in cleanup loop: {e}")
                 # Continue running despite errors
@@ -498,31 +668,66 @@ class TaskDaemon:
             "pid": os.getpid(),
             "version": __version__,
         }
-        with open(self.pid_file, "w") as f:
-            json.dump(pid_data, f)
+        # Write to a temp file and rename so readers never see a partial file
+        tmp_file = self.pid_file.with_suffix(self.pid_file.suffix + ".tmp")
+        tmp_file.write_bytes(fastjson.dumps_bytes(pid_data))
+        os.replace(tmp_file, self.pid_file)
+
+    def _signal_ready(self) -> None:
+        """Write a byte to the readiness pipe, if one was provided, and close it."""
+        if self.ready_fd is None:
+            return
+
+        try:
+            os.write(self.ready_fd, b"1")
+        except OSError as e:
+            logger.warning(f"Failed to signal readiness: {e}")
+        finally:
+            try:
+                os.close(self.ready_fd)
+            except OSError:
+                pass
+            self.ready_fd = None
 
     def _remove_pid_file(self) -> None:
         """Remove PID file."""
-        if self.pid_file.exists():
-            self.pid_file.unlink()
+        self.pid_file.unlink(missing_ok=True)
 
     def _setup_signal_handlers(self) -> None:
         """Set up signal handlers for graceful shutdown."""
+        if _IS_WINDOWS:
+            # Windows event loops have no add_signal_handler; fall back to
+            # Python-level handlers that hand off to the loop thread-safely
+            def signal_handler(signum, frame):
+                self._loop.call_soon_threadsafe(self._handle_signal, signum)
+
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
+            if hasattr(signal, "SIGBREAK"):
+                signal.signal(signal.SIGBREAK, signal_handler)
+            return
 
-        def signal_handler(signum, frame):
-            print(f"\nReceived signal {signum}")
-            self._running = False
+        # Handlers run inside the event loop, woken through its wakeup fd
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            self._loop.add_signal_handler(sig, self._handle_signal, sig)
+            self._signals.append(sig)
 
-        # Set up platform-appropriate signal handlers
-        signal.signal(signal.SIGINT, signal_handler)
+    def _remove_signal_handlers(self) -> None:
+        """Remove signal handlers installed on the event loop."""
+        while self._signals:
+            self._loop.remove_signal_handler(self._signals.pop())
 
-        # SIGTERM is not available on Windows
-        if hasattr(signal, "SIGTERM"):
-            signal.signal(signal.SIGTERM, signal_handler)
+    def _handle_signal(self, signum: int) -> None:
+        """
+        Request shutdown in response to a signal.
 
-        # On Windows, also handle SIGBREAK if available
-        if platform.system() == "Windows" and hasattr(signal, "SIGBREAK"):
-            signal.signal(signal.SIGBREAK, signal_handler)
+        Args:
+            signum: Signal number
+        """
+        print(f"\nReceived signal {signum}")
+        # Already on the event loop thread, so start shutting down right away
+        if not self._stop_event.is_set():
+            self._shutdown_task = asyncio.create_task(self.stop())
 
     @staticmethod
     def is_running(pid_file: str = "~/.exobrain/task-daemon.pid") -> bool:
@@ -535,20 +740,12 @@ class TaskDaemon:
         Returns:
             True if daemon is running, False otherwise
         """
-        pid_file_path = Path(pid_file).expanduser()
-
-        if not pid_file_path.exists():
+        pid = _read_pid(Path(pid_file).expanduser())
+        if pid is None:
             return False
 
-        try:
-            with open(pid_file_path, "r") as f:
-                pid = int(f.read().strip())
-
-            # Check if process exists (cross-platform)
-            return _is_process_running(pid)
-
-        except (ValueError, IOError):
-            return False
+        # Check if process exists (cross-platform)
+        return _is_process_running(pid)
 
     @staticmethod
     def get_pid(pid_file: str = "~/.exobrain/task-daemon.pid") -> Optional[int]:
@@ -561,13 +758,4 @@ class TaskDaemon:
         Returns:
             PID if daemon is running, None otherwise
         """
-        pid_file_path = Path(pid_file).expanduser()
-
-        if not pid_file_path.exists():
-            return None
-
-        try:
-            with open(pid_file_path, "r") as f:
-                return int(f.read().strip())
-        except (ValueError, IOError):
-            return None
+        return _read_pid(Path(pid_file).expanduser())
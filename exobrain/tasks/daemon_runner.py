@@ -53,6 +53,9 @@ def main():
     parser.add_argument(
         "--pid-file", default="~/.exobrain/task-daemon.pid", help="Path to PID file"
     )
+    parser.add_argument(
+        "--ready-fd", type=int, help="File descriptor to write to once the daemon is ready"
+    )
 
     args = parser.parse_args()
 
@@ -81,6 +84,7 @@ def main():
         transport_type=transport_type,
         transport_config=transport_config,
         pid_file=args.pid_file,
+        ready_fd=args.ready_fd,
     )
 
     # Run daemon
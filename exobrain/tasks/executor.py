@@ -1,16 +1,23 @@
 """Task executors for different task types."""
 
 import asyncio
+import codecs
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
 from pathlib import Path
-from typing import Optional
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
 from .models import Task
 from .storage import TaskStorage
 
 logger = logging.getLogger(__name__)
 
+# Windows Proactor event loops don't support add_reader on pipes
+_USE_FD_READER = os.name != "nt"
+
 
 class TaskExecutor(ABC):
     """
@@ -19,6 +26,14 @@ class TaskExecutor(ABC):
     Executors handle the actual execution of tasks.
     """
 
+    # Output is coalesced and written once either threshold is reached
+    OUTPUT_FLUSH_CHARS = 4096
+    OUTPUT_FLUSH_INTERVAL = 0.05  # seconds
+
+    # Minimum progress change and time between progress writes to storage
+    PROGRESS_SAVE_DELTA = 0.01
+    PROGRESS_SAVE_INTERVAL = 0.5  # seconds
+
     def __init__(self, task: Task, storage: TaskStorage):
         """
         Initialize task executor.
@@ -30,6 +45,13 @@ class TaskExecutor(ABC):
         self.task = task
         self.storage = storage
         self._cancelled = False
+        self._last_saved_progress = task.progress
+        self._last_progress_save = float("-inf")
+        self._progress_dirty = False
+        self._output_buffer: List[str] = []
+        self._output_buffer_chars = 0
+        self._last_output_flush = time.monotonic()
+        self._output_flusher: Optional[asyncio.Task] = None
 
     @abstractmethod
     async def execute(self) -> None:
@@ -56,6 +78,60 @@ class TaskExecutor(ABC):
         """
         await self.storage.append_output(self.task.task_id, text)
 
+    async def _buffer_output(self, text: str) -> None:
+        """
+        Buffer output, flushing it when the size or time threshold is reached.
+
+        Args:
+            text: Text to append
+        """
+        self._output_buffer.append(text)
+        self._output_buffer_chars += len(text)
+
+        if (
+            self._output_buffer_chars >= self.OUTPUT_FLUSH_CHARS
+            or time.monotonic() - self._last_output_flush >= self.OUTPUT_FLUSH_INTERVAL
+        ):
+            await self._flush_output()
+
+    async def _flush_output(self) -> None:
+        """Write any buffered output to storage."""
+        self._last_output_flush = time.monotonic()
+        if not self._output_buffer:
+            return
+
+        text = "".join(self._output_buffer)
+        self._output_buffer.clear()
+        self._output_buffer_chars = 0
+        await self._append_output(text)
+
+    def _start_output_flusher(self) -> None:
+        """Start a background task that flushes buffered output left idle in the buffer."""
+        self._last_output_flush = time.monotonic()
+        if self._output_flusher is None:
+            self._output_flusher = asyncio.create_task(self._run_output_flusher())
+
+    async def _stop_output_flusher(self) -> None:
+        """Stop the background flusher and write any remaining buffered output."""
+        if self._output_flusher is not None:
+            self._output_flusher.cancel()
+            try:
+                await self._output_flusher
+            except asyncio.CancelledError:
+                pass
+            self._output_flusher = None
+        await self._flush_output()
+
+    async def _run_output_flusher(self) -> None:
+        """Flush buffered output once it has waited OUTPUT_FLUSH_INTERVAL."""
+        while True:
+            await asyncio.sleep(self.OUTPUT_FLUSH_INTERVAL)
+            if (
+                self._output_buffer
+                and time.monotonic() - self._last_output_flush >= self.OUTPUT_FLUSH_INTERVAL
+            ):
+                await self._flush_output()
+
     async def _update_progress(self, progress: float) -> None:
         """
         Update task progress.
@@ -64,7 +140,39 @@ class TaskExecutor(ABC):
             progress: Progress value (0.0 to 1.0)
         """
         self.task.progress = progress
+
+        # Only persist meaningful, spaced-out changes; the rest is saved by _flush_progress
+        if self._progress_save_due(progress):
+            await self._save_progress()
+        else:
+            self._progress_dirty = True
+
+    def _progress_save_due(self, progress: float) -> bool:
+        """
+        Check whether a progress value should be persisted now.
+
+        Args:
+            progress: Progress value (0.0 to 1.0)
+
+        Returns:
+            True if the change is large enough and the save interval has passed
+        """
+        return progress >= 1.0 or (
+            progress - self._last_saved_progress >= self.PROGRESS_SAVE_DELTA
+            and time.monotonic() - self._last_progress_save >= self.PROGRESS_SAVE_INTERVAL
+        )
+
+    async def _save_progress(self) -> None:
+        """Persist the task with its current progress."""
         await self.storage.save_task(self.task)
+        self._last_saved_progress = self.task.progress
+        self._last_progress_save = time.monotonic()
+        self._progress_dirty = False
+
+    async def _flush_progress(self) -> None:
+        """Persist progress updates that were held back by _update_progress."""
+        if self._progress_dirty:
+            await self._save_progress()
 
 
 class AgentExecutor(TaskExecutor):
@@ -74,112 +182,215 @@ class AgentExecutor(TaskExecutor):
     Runs an agent with the given configuration.
     """
 
-    def _truncate_tool_output(self, text: str, max_lines: int = 50, max_chars: int = 1200) -> str:
+    # (config file signature, loaded config) shared by all agent tasks in the daemon
+    _config_cache: Optional[Tuple[Tuple, Any]] = None
+    _config_lock: Optional[asyncio.Lock] = None
+
+    # Buffering rarely awaits, so give other tasks a turn every this many chunks
+    STREAM_YIELD_CHUNKS = 32
+
+    # Idle agents kept for reuse, keyed by (config signature, model spec, extra allowed dir)
+    AGENT_POOL_SIZE = 4
+    _agent_pool: Dict[Tuple, List[Any]] = {}
+
+    def __init__(self, task: Task, storage: TaskStorage):
         """
-        Truncate tool output in task output text while preserving agent messages.
+        Initialize agent executor.
 
         Args:
-            text: Text that may contain tool output
-            max_lines: Maximum number of lines for tool output
-            max_chars: Maximum number of characters for tool output
+            task: Task to execute
+            storage: Task storage instance
+        """
+        super().__init__(task, storage)
+
+    @staticmethod
+    def _config_signature() -> Tuple:
+        """
+        Get a signature of the config files load_config reads.
 
         Returns:
-            Text with tool output truncated if needed
+            Tuple of (path, mtime_ns, size) for each candidate config file
+        """
+        from exobrain.config import get_user_config_path
 
-        todo)): this is a workaround solution, we should handle this better with unified event handling.
+        signature = []
+        for path in (get_user_config_path(), Path.cwd() / ".exobrain" / "config.yaml"):
+            try:
+                st = path.stat()
+                signature.append((str(path), st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append((str(path), None, None))
+        return tuple(signature)
+
+    @classmethod
+    async def _load_config(cls) -> Any:
         """
-        # Check if this chunk contains tool output (format: "[Tool: tool_name]\n{output}\n")
-        if not text.startswith("\n\n[Tool: ") and "[Tool: " not in text:
-            # Not a tool output chunk, return as-is
-            return text
+        Load configuration, reusing the parsed result while config files are unchanged.
 
-        # Extract tool name and output
-        lines = text.split("\n")
-        tool_header_idx = -1
-        for i, line in enumerate(lines):
-            if line.startswith("[Tool: "):
-                tool_header_idx = i
-                break
+        Returns:
+            A private copy of the config that the caller may modify
+        """
+        from exobrain.config import load_config
 
-        if tool_header_idx == -1:
-            return text
+        signature = cls._config_signature()
+        cached = cls._config_cache
+        if cached is None or cached[0] != signature:
+            if cls._config_lock is None:
+                cls._config_lock = asyncio.Lock()
+
+            # Tasks starting together parse the YAML once, off the event loop
+            async with cls._config_lock:
+                cached = cls._config_cache
+                if cached is None or cached[0] != signature:
+                    config, _ = await asyncio.to_thread(load_config)
+                    cls._config_cache = cached = (signature, config)
+                    # Agents built from the old config must not be handed out again
+                    cls._agent_pool.clear()
+
+        # Tasks adjust the config (e.g. allowed directories), so never share it
+        return cached[1].model_copy(deep=True)
+
+    @classmethod
+    def _acquire_agent(cls, key: Tuple) -> Optional[Any]:
+        """
+        Take an idle agent from the pool.
 
-        # Split into: prefix + tool header + tool output + suffix
-        prefix_lines = lines[:tool_header_idx]
-        tool_header = lines[tool_header_idx]
-        output_start_idx = tool_header_idx + 1
+        Args:
+            key: Pool key the agent was built for
 
-        # Find where tool output ends (empty line or end of text)
-        output_end_idx = len(lines)
-        for i in range(output_start_idx, len(lines)):
-            if not lines[i].strip():
-                output_end_idx = i
-                break
+        Returns:
+            A reset agent, or None if none is idle
+        """
+        pool = cls._agent_pool.get(key)
+        return pool.pop() if pool else None
 
-        output_lines = lines[output_start_idx:output_end_idx]
-        suffix_lines = lines[output_end_idx:]
+    @classmethod
+    def _release_agent(cls, key: Tuple, agent: Any) -> None:
+        """
+        Reset an agent's per-task state and return it to the pool.
+
+        Args:
+            key: Pool key the agent was built for
+            agent: Agent that finished its task
+        """
+        agent.events.clear()
+        agent.clear_history()
+        agent.runtime_permissions = {}
 
-        # Check if truncation is needed
-        output_text = "\n".join(output_lines)
-        needs_truncation = len(output_lines) > max_lines or len(output_text) > max_chars
+        pool = cls._agent_pool.setdefault(key, [])
+        if len(pool) < cls.AGENT_POOL_SIZE:
+            pool.append(agent)
 
-        if not needs_truncation:
-            return text
+    @staticmethod
+    def _format_tool_output(chunk: Any, max_lines: int = 50, max_chars: int = 1200) -> str:
+        """
+        Format a streamed tool result, truncating long tool output.
+
+        Args:
+            chunk: ToolOutputChunk carrying the tool name and raw output
+            max_lines: Maximum number of lines for tool output
+            max_chars: Maximum number of characters for tool output
 
-        # Truncate output
-        if len(output_lines) > max_lines:
-            truncated_output_lines = output_lines[:max_lines]
-            remaining_lines = len(output_lines) - max_lines
-            truncated_output_lines.append(
-                f"[Content truncated: {remaining_lines} more lines. Total {len(output_lines)} lines.]"
+        Returns:
+            Tool output text with the output truncated if needed
+        """
+        output = chunk.output
+
+        # Most tool results are short, keep the already formatted text
+        line_count = output.count("\n") + 1
+        if line_count <= max_lines and len(output) <= max_chars:
+            return str(chunk)
+
+        if line_count > max_lines:
+            # Cut after the max_lines-th line without splitting the whole output
+            cut = -1
+            for _ in range(max_lines):
+                cut = output.find("\n", cut + 1)
+            output = (
+                f"{output[:cut]}\n[Content truncated: {line_count - max_lines} more lines. "
+                f"Total {line_count} lines.]"
             )
-        else:
-            truncated_output_lines = output_lines
 
-        truncated_output = "\n".join(truncated_output_lines)
-        if len(truncated_output) > max_chars:
-            truncated_output = truncated_output[:max_chars]
-            truncated_output += "\n[Content truncated at {max_chars} characters.]"
+        if len(output) > max_chars:
+            output = f"{output[:max_chars]}\n[Content truncated at {max_chars} characters.]"
+
+        return f"\n\n[Tool: {chunk.tool_name}]\n{output}\n"
 
-        # Reconstruct text
-        result_lines = prefix_lines + [tool_header] + [truncated_output] + suffix_lines
-        return "\n".join(result_lines)
+    def _on_iteration_started(self, event: Any) -> Optional[Awaitable[None]]:
+        """
+        Track agent iterations in memory.
+
+        The handler is synchronous so the event manager calls it inline instead of
+        scheduling a task per iteration; only throttled saves return an awaitable.
+
+        Args:
+            event: IterationStartedEvent
+
+        Returns:
+            Awaitable that persists progress when a save is due, otherwise None
+        """
+        self.task.iterations = event.iteration
+        progress = min(event.iteration / event.max_iterations, 1.0)
+        self.task.progress = progress
+        logger.info(f"Iteration {event.iteration}/{event.max_iterations} started")
+
+        if self._progress_save_due(progress):
+            return self._save_progress()
+        self._progress_dirty = True
+        return None
+
+    def _on_state_changed(self, event: Any) -> Optional[Awaitable[None]]:
+        """
+        Flush buffered output when the agent starts calling tools.
+
+        The stream pauses while tools run, so text is not held back until then.
+
+        Args:
+            event: StateChangedEvent
+
+        Returns:
+            Awaitable that flushes output on tool calls, otherwise None
+        """
+        from exobrain.agent.base import AgentState
+
+        if event.new_state == AgentState.TOOL_CALLING.value:
+            return self._flush_output()
+        return None
 
     async def execute(self) -> None:
         """Execute agent task."""
         logger.info(f"AgentExecutor.execute() started for task_id={self.task.task_id}")
 
         # Import here to avoid circular dependency
-        from exobrain.agent.events import EventType, IterationStartedEvent
+        from exobrain.agent.base import ToolOutputChunk
+        from exobrain.agent.events import EventType
         from exobrain.cli.util import create_agent_from_config
-        from exobrain.config import load_config
 
         try:
             # Get configuration
             logger.info("Loading config")
-            config, _ = load_config()
+            config = await self._load_config()
             logger.info(f"Config loaded successfully")
 
             # Check if task has a working directory with .exobrain folder
             # If so, add it to allowed directories for shell execution
             working_dir = self.task.config.get("working_directory")
+            allowed_dir = None
             if working_dir:
                 working_dir_path = Path(working_dir)
-                exobrain_dir = working_dir_path / ".exobrain"
-                if exobrain_dir.exists() and exobrain_dir.is_dir():
-                    # Ensure shell_execution permissions exist in config
-                    if hasattr(config.permissions, "shell_execution"):
-                        shell_exec_config = config.permissions.shell_execution
-                        if not hasattr(shell_exec_config, "allowed_directories"):
-                            shell_exec_config.allowed_directories = []
-
-                        # Add working directory if not already in allowed list
-                        working_dir_str = str(working_dir_path)
-                        if working_dir_str not in shell_exec_config.allowed_directories:
-                            shell_exec_config.allowed_directories.append(working_dir_str)
-                            logger.info(
-                                f"Detected .exobrain in task working directory, automatically allowing: {working_dir_str}"
-                            )
+                if (working_dir_path / ".exobrain").is_dir():
+                    # shell_execution is a plain dict that always exists on PermissionsConfig
+                    allowed_directories = config.permissions.shell_execution.setdefault(
+                        "allowed_directories", []
+                    )
+
+                    # Add working directory if not already in allowed list
+                    working_dir_str = allowed_dir = str(working_dir_path)
+                    if working_dir_str not in allowed_directories:
+                        allowed_directories.append(working_dir_str)
+                        logger.info(
+                            f"Detected .exobrain in task working directory, automatically allowing: {working_dir_str}"
+                        )
 
             # Get agent configuration from task config
             agent_config = self.task.config.copy()
@@ -196,20 +407,19 @@ class AgentExecutor(TaskExecutor):
             # Get model spec if provided
             model_spec = agent_config.pop("model", None)
 
-            # Create agent
-            logger.info("Creating Agent instance")
-            agent, _ = create_agent_from_config(config, model_spec=model_spec)
-            logger.info("Agent instance created")
-
-            # Register event handler to track iterations
-            async def on_iteration_started(event):
-                if isinstance(event, IterationStartedEvent):
-                    self.task.iterations = event.iteration
-                    progress = min(event.iteration / event.max_iterations, 1.0)
-                    await self._update_progress(progress)
-                    logger.info(f"Iteration {event.iteration}/{event.max_iterations} started")
+            # Reuse an idle agent built from the same config, or create one
+            agent_key = (AgentExecutor._config_cache[0], model_spec, allowed_dir)
+            agent = self._acquire_agent(agent_key)
+            if agent is None:
+                logger.info("Creating Agent instance")
+                agent, _ = create_agent_from_config(config, model_spec=model_spec)
+                logger.info("Agent instance created")
+            else:
+                logger.info("Reusing pooled Agent instance")
 
-            agent.events.register(on_iteration_started, EventType.ITERATION_STARTED)
+            # Register event handlers to track iterations and flush around tool calls
+            agent.events.register(self._on_iteration_started, EventType.ITERATION_STARTED)
+            agent.events.register(self._on_state_changed, EventType.STATE_CHANGED)
 
             # Run agent
             logger.info("Starting agent.process_message()")
@@ -217,27 +427,52 @@ class AgentExecutor(TaskExecutor):
             # Process the message
             result = await agent.process_message(prompt)
 
-            # Handle streaming vs non-streaming
-            if hasattr(result, "__aiter__"):
+            # Handle streaming vs non-streaming; agents return either a plain
+            # string or an async generator, so test the common str case first
+            if type(result) is not str and isinstance(result, AsyncIterable):  # noqa: E721
                 # Streaming response
+                self._start_output_flusher()
+                n_chunks = 0
                 async for chunk in result:
                     # Check if cancelled
                     if self._cancelled:
                         logger.info("Task cancelled, breaking loop")
                         break
 
-                    # Truncate tool output if present, keep agent messages full
-                    chunk_str = str(chunk)
-                    truncated_chunk = self._truncate_tool_output(chunk_str)
-                    await self._append_output(truncated_chunk)
+                    # Providers may hand over many buffered chunks without suspending
+                    n_chunks += 1
+                    if n_chunks >= self.STREAM_YIELD_CHUNKS:
+                        n_chunks = 0
+                        await asyncio.sleep(0)
+
+                    # Exact type check: ToolOutputChunk subclasses str and must not
+                    # take this untruncated branch, so isinstance() would be wrong
+                    if type(chunk) is str:  # noqa: E721
+                        await self._buffer_output(chunk)
+                    elif isinstance(chunk, ToolOutputChunk):
+                        # Truncate tool output, keep agent messages full; tool results
+                        # arrive as complete blocks, so write them out right away
+                        await self._buffer_output(self._format_tool_output(chunk))
+                        await self._flush_output()
+                    else:
+                        await self._buffer_output(str(chunk))
+
+                await self._flush_output()
             else:
                 # Non-streaming response
-                await self._append_output(str(result))
+                # Exact type check skips the str() copy only for plain strings
+                await self._append_output(
+                    result if type(result) is str else str(result)  # noqa: E721
+                )
                 # For non-streaming, set iterations to 1 if not already set
                 if self.task.iterations == 0:
                     self.task.iterations = 1
                     await self._update_progress(1.0)
 
+            # Only agents that ran to completion are in a state that can be reset
+            if not self._cancelled:
+                self._release_agent(agent_key, agent)
+
             logger.info(
                 f"AgentExecutor.execute() completed for task_id={self.task.task_id}, iterations={self.task.iterations}"
             )
@@ -248,9 +483,15 @@ class AgentExecutor(TaskExecutor):
                 f"AgentExecutor.execute() failed for task_id={self.task.task_id}: {str(e)}",
                 exc_info=True,
             )
+            await self._flush_output()
             await self._append_output(f"\nError: {str(e)}\n")
             raise
 
+        finally:
+            # Don't lose buffered output or progress on cancellation
+            await self._stop_output_flusher()
+            await self._flush_progress()
+
 
 class ProcessExecutor(TaskExecutor):
     """
@@ -259,6 +500,12 @@ class ProcessExecutor(TaskExecutor):
     Runs a subprocess with the given command.
     """
 
+    READ_CHUNK_SIZE = 65536
+    # Output bytes read but not yet written before the pipe reader is paused
+    MAX_PENDING_OUTPUT = 1024 * 1024
+    # Seconds a terminated process gets to exit before it is killed
+    TERMINATE_TIMEOUT = 5.0
+
     def __init__(self, task: Task, storage: TaskStorage):
         """
         Initialize process executor.
@@ -286,34 +533,47 @@ class ProcessExecutor(TaskExecutor):
         else:
             working_dir = Path.cwd()
 
+        read_fd = None
         try:
-            # Start process
-            self._process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
-                cwd=str(working_dir),
-            )
+            # Start process. On POSIX, output goes to a raw pipe read straight
+            # from the event loop; Windows (no add_reader on Proactor) uses PIPE.
+            if _USE_FD_READER:
+                read_fd, write_fd = os.pipe()
+                os.set_blocking(read_fd, False)
+                try:
+                    self._process = await asyncio.create_subprocess_shell(
+                        command,
+                        stdout=write_fd,
+                        stderr=write_fd,
+                        cwd=str(working_dir),
+                    )
+                finally:
+                    # Only the child keeps the write end, so EOF arrives when it exits
+                    os.close(write_fd)
+            else:
+                self._process = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
+                    cwd=str(working_dir),
+                )
 
             # Store PID
             self.task.pid = self._process.pid
             await self.storage.save_task(self.task)
 
-            # Read output
-            if self._process.stdout:
-                while True:
-                    # Check if cancelled
-                    if self._cancelled:
-                        break
-
-                    # Read line
-                    line = await self._process.stdout.readline()
-                    if not line:
-                        break
+            # Incremental decoder keeps multi-byte characters split across reads intact
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            self._start_output_flusher()
+            if read_fd is not None:
+                await self._read_output_fd(read_fd, decoder)
+            elif self._process.stdout:
+                await self._read_output_stream(self._process.stdout, decoder)
 
-                    # Decode and append
-                    text = line.decode("utf-8", errors="replace")
-                    await self._append_output(text)
+            text = decoder.decode(b"", final=True)
+            if text:
+                await self._buffer_output(text)
+            await self._flush_output()
 
             # Wait for process to complete
             exit_code = await self._process.wait()
@@ -331,18 +591,123 @@ class ProcessExecutor(TaskExecutor):
 
         except Exception as e:
             # Log error
+            await self._flush_output()
             await self._append_output(f"\nError: {str(e)}\n")
             raise
 
         finally:
+            await self._stop_output_flusher()
+            if read_fd is not None:
+                os.close(read_fd)
+
             # Clean up process
-            if self._process and self._process.returncode is None:
-                try:
-                    self._process.terminate()
-                    await asyncio.wait_for(self._process.wait(), timeout=5.0)
-                except asyncio.TimeoutError:
-                    self._process.kill()
-                    await self._process.wait()
+            await self._terminate()
+
+    async def _read_output_fd(self, read_fd: int, decoder: codecs.IncrementalDecoder) -> None:
+        """
+        Read process output from a non-blocking pipe registered with the event loop.
+
+        Data is read in the reader callback itself and handed over in batches,
+        pausing the reader while more than MAX_PENDING_OUTPUT bytes are pending.
+
+        Args:
+            read_fd: Read end of the output pipe
+            decoder: Incremental UTF-8 decoder
+        """
+        loop = asyncio.get_running_loop()
+        chunks: List[bytes] = []
+        pending = 0
+        eof = False
+        reading = False
+        data_ready = asyncio.Event()
+
+        def on_readable() -> None:
+            nonlocal pending, eof, reading
+            try:
+                data = os.read(read_fd, self.READ_CHUNK_SIZE)
+            except BlockingIOError:
+                return
+            except OSError:
+                data = b""
+
+            if data:
+                chunks.append(data)
+                pending += len(data)
+                if pending >= self.MAX_PENDING_OUTPUT:
+                    loop.remove_reader(read_fd)
+                    reading = False
+            else:
+                eof = True
+                loop.remove_reader(read_fd)
+                reading = False
+            data_ready.set()
+
+        try:
+            while True:
+                if not eof and not reading:
+                    loop.add_reader(read_fd, on_readable)
+                    reading = True
+
+                await data_ready.wait()
+                data_ready.clear()
+
+                # Check if cancelled
+                if self._cancelled:
+                    break
+
+                if chunks:
+                    data = b"".join(chunks)
+                    chunks.clear()
+                    pending = 0
+                    text = decoder.decode(data)
+                    if text:
+                        await self._buffer_output(text)
+
+                if eof:
+                    break
+        finally:
+            if reading:
+                loop.remove_reader(read_fd)
+
+    async def _read_output_stream(
+        self, stream: asyncio.StreamReader, decoder: codecs.IncrementalDecoder
+    ) -> None:
+        """
+        Read process output from an asyncio stream in chunks of up to READ_CHUNK_SIZE.
+
+        Args:
+            stream: Process stdout stream
+            decoder: Incremental UTF-8 decoder
+        """
+        while True:
+            # Check if cancelled
+            if self._cancelled:
+                break
+
+            chunk = await stream.read(self.READ_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            text = decoder.decode(chunk)
+            if text:
+                await self._buffer_output(text)
+
+    async def _terminate(self) -> None:
+        """Terminate the process if it is running, killing it if it does not exit in time."""
+        if self._process is None or self._process.returncode is not None:
+            return
+
+        try:
+            # Try graceful termination first
+            self._process.terminate()
+            await asyncio.wait_for(self._process.wait(), timeout=self.TERMINATE_TIMEOUT)
+        except ProcessLookupError:
+            # Exited between the returncode check and the signal
+            await self._process.wait()
+        except asyncio.TimeoutError:
+            # Force kill if termination times out
+            self._process.kill()
+            await self._process.wait()
 
     async def cancel(self) -> None:
         """Cancel the process execution."""
@@ -350,13 +715,7 @@ class ProcessExecutor(TaskExecutor):
 
         # Terminate process
         if self._process and self._process.returncode is None:
-            try:
-                # Try graceful termination first
-                self._process.terminate()
-                await asyncio.wait_for(self._process.wait(), timeout=5.0)
-            except asyncio.TimeoutError:
-                # Force kill if termination times out
-                self._process.kill()
-                await self._process.wait()
+            await self._terminate()
 
+            await self._flush_output()
             await self._append_output("\n--- Process cancelled ---\n")
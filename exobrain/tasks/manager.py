@@ -3,7 +3,7 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Set
 
 from .executor import AgentExecutor, ProcessExecutor, TaskExecutor
 from .models import Task, TaskStatus, TaskType
@@ -52,8 +52,12 @@ class TaskManager:
         self._executors: Dict[str, TaskExecutor] = {}
         self._task_futures: Dict[str, asyncio.Task] = {}
 
-        # Semaphore for concurrent task limit
-        self._semaphore = asyncio.Semaphore(max_concurrent_tasks)
+        # IDs of in-memory tasks that are pending or running
+        self._active_ids: Set[str] = set()
+
+        # Queued tasks are run by max_concurrent_tasks workers
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
 
         self._initialized = True
 
@@ -70,8 +74,26 @@ class TaskManager:
             task.error = "Daemon restarted while task was running"
             await self.storage.save_task(task)
 
+        # Tasks still queued when the previous daemon died will never be picked up
+        for task in await self.storage.list_tasks(status=TaskStatus.PENDING):
+            task.status = TaskStatus.INTERRUPTED
+            task.error = "Daemon restarted before task was started"
+            await self.storage.save_task(task)
+
+        self._start_workers()
+
         logger.info("Task manager initialized")
 
+    def _start_workers(self) -> None:
+        """Start the worker pool if it is not running."""
+        if self._workers:
+            return
+
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.max_concurrent_tasks)
+        ]
+
     async def create_task(
         self,
         name: str,
@@ -106,12 +128,13 @@ class TaskManager:
             task.command = config.get("command")
             task.working_directory = config.get("working_directory")
 
-        # Save task
+        # Save task before returning, so it is visible to storage-backed listing
         await self.storage.save_task(task)
         logger.info(f"Task saved: task_id={task.task_id}, status={task.status.value}")
 
         # Store in memory
         self._tasks[task.task_id] = task
+        self._active_ids.add(task.task_id)
 
         # Start task execution
         logger.info(f"Starting task execution: task_id={task.task_id}")
@@ -157,7 +180,26 @@ class TaskManager:
         """
         return await self.storage.list_tasks(status, task_type, limit)
 
-    async def cancel_task(self, task_id: str) -> bool:
+    def iter_tasks(
+        self,
+        status: Optional[TaskStatus] = None,
+        task_type: Optional[TaskType] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Task]:
+        """
+        Iterate over tasks with optional filters without loading them all at once.
+
+        Args:
+            status: Filter by status
+            task_type: Filter by type
+            limit: Maximum number of tasks to yield
+
+        Returns:
+            Async iterator of tasks
+        """
+        return self.storage.iter_tasks(status, task_type, limit)
+
+    async def cancel_task(self, task_id: str) -> Optional[Task]:
         """
         Cancel a running task.
 
@@ -165,18 +207,32 @@ class TaskManager:
             task_id: Task ID
 
         Returns:
-            True if task was cancelled, False otherwise
+            The cancelled task, or None if it was not found or not active
         """
         task = self._tasks.get(task_id)
-        if not task:
+        if task is None:
+            # Not started by this daemon, only storage knows about it
             task = await self.storage.load_task(task_id)
-
-        if not task:
-            return False
+            if task is None:
+                return None
 
         # Check if task is active
         if not task.is_active:
-            return False
+            return None
+
+        return await self._cancel_active_task(task)
+
+    async def _cancel_active_task(self, task: Task) -> Task:
+        """
+        Cancel a task that is known to be active.
+
+        Args:
+            task: Active task
+
+        Returns:
+            The cancelled task
+        """
+        task_id = task.task_id
 
         # Cancel executor
         executor = self._executors.get(task_id)
@@ -191,9 +247,10 @@ class TaskManager:
         # Update task status
         task.status = TaskStatus.CANCELLED
         task.completed_at = datetime.now()
+        self._active_ids.discard(task_id)
         await self.storage.save_task(task)
 
-        return True
+        return task
 
     async def delete_task(self, task_id: str) -> bool:
         """
@@ -208,15 +265,13 @@ class TaskManager:
         # Cancel if running
         task = self._tasks.get(task_id)
         if task and task.is_active:
-            await self.cancel_task(task_id)
+            await self._cancel_active_task(task)
 
         # Remove from memory
-        if task_id in self._tasks:
-            del self._tasks[task_id]
-        if task_id in self._executors:
-            del self._executors[task_id]
-        if task_id in self._task_futures:
-            del self._task_futures[task_id]
+        self._active_ids.discard(task_id)
+        self._tasks.pop(task_id, None)
+        self._executors.pop(task_id, None)
+        self._task_futures.pop(task_id, None)
 
         # Delete from storage
         return await self.storage.delete_task(task_id)
@@ -242,11 +297,30 @@ class TaskManager:
 
         self._executors[task.task_id] = executor
 
-        # Create task future
-        logger.info(f"Creating asyncio task for task_id={task.task_id}")
-        future = asyncio.create_task(self._run_task(task, executor))
-        self._task_futures[task.task_id] = future
-        logger.info(f"Task future created and stored for task_id={task.task_id}")
+        # Queue task for the worker pool
+        self._start_workers()
+        self._queue.put_nowait((task, executor))
+        logger.info(
+            f"Task queued: task_id={task.task_id}, queued={self._queue.qsize()}, "
+            f"active={self.active_task_count}/{self.max_concurrent_tasks}"
+        )
+
+    async def _worker(self) -> None:
+        """Run queued tasks one at a time."""
+        while True:
+            task, executor = await self._queue.get()
+            try:
+                # Skip tasks cancelled while waiting in the queue
+                if task.status == TaskStatus.PENDING:
+                    # Run in a separate asyncio task so cancelling it leaves the worker alive
+                    future = asyncio.create_task(self._run_task(task, executor))
+                    self._task_futures[task.task_id] = future
+                    await asyncio.wait((future,))
+            finally:
+                # _run_task cleans up too, but never runs if cancelled before starting
+                self._executors.pop(task.task_id, None)
+                self._task_futures.pop(task.task_id, None)
+                self._queue.task_done()
 
     async def _run_task(self, task: Task, executor: TaskExecutor) -> None:
         """
@@ -257,70 +331,77 @@ class TaskManager:
             executor: Task executor
         """
         logger.info(f"_run_task started for task_id={task.task_id}")
-        logger.info(
-            f"Waiting for semaphore (current active: {self.active_task_count}/{self.max_concurrent_tasks})"
-        )
+        try:
+            # Update task status
+            task.status = TaskStatus.RUNNING
+            task.started_at = datetime.now()
+            await self.storage.save_task(task)
+            logger.info(f"Task status updated to RUNNING: task_id={task.task_id}")
 
-        async with self._semaphore:
-            logger.info(f"Acquired semaphore for task_id={task.task_id}")
-            try:
-                # Update task status
-                task.status = TaskStatus.RUNNING
-                task.started_at = datetime.now()
-                await self.storage.save_task(task)
-                logger.info(f"Task status updated to RUNNING: task_id={task.task_id}")
-
-                # Execute task
-                logger.info(f"Starting executor.execute() for task_id={task.task_id}")
-                await executor.execute()
-                logger.info(f"Executor.execute() completed for task_id={task.task_id}")
-
-                # Update task status
-                if task.status == TaskStatus.RUNNING:
-                    task.status = TaskStatus.COMPLETED
-                    task.completed_at = datetime.now()
-                    await self.storage.save_task(task)
-                    logger.info(f"Task completed successfully: task_id={task.task_id}")
-
-            except asyncio.CancelledError:
-                # Task was cancelled
-                logger.info(f"Task cancelled: task_id={task.task_id}")
-                task.status = TaskStatus.CANCELLED
-                task.completed_at = datetime.now()
-                await self.storage.save_task(task)
+            # Execute task
+            logger.info(f"Starting executor.execute() for task_id={task.task_id}")
+            await executor.execute()
+            logger.info(f"Executor.execute() completed for task_id={task.task_id}")
 
-            except Exception as e:
-                # Task failed
-                logger.error(f"Task failed: task_id={task.task_id}, error={str(e)}", exc_info=True)
-                task.status = TaskStatus.FAILED
-                task.error = str(e)
+            # Update task status
+            if task.status == TaskStatus.RUNNING:
+                task.status = TaskStatus.COMPLETED
                 task.completed_at = datetime.now()
                 await self.storage.save_task(task)
+                logger.info(f"Task completed successfully: task_id={task.task_id}")
 
-            finally:
-                # Clean up
-                logger.info(f"Cleaning up task: task_id={task.task_id}")
-                if task.task_id in self._executors:
-                    del self._executors[task.task_id]
-                if task.task_id in self._task_futures:
-                    del self._task_futures[task.task_id]
+        except asyncio.CancelledError:
+            # Task was cancelled
+            logger.info(f"Task cancelled: task_id={task.task_id}")
+            task.status = TaskStatus.CANCELLED
+            task.completed_at = datetime.now()
+            await self.storage.save_task(task)
+
+        except Exception as e:
+            # Task failed
+            logger.error(f"Task failed: task_id={task.task_id}, error={str(e)}", exc_info=True)
+            task.status = TaskStatus.FAILED
+            task.error = str(e)
+            task.completed_at = datetime.now()
+            await self.storage.save_task(task)
+
+        finally:
+            # Clean up
+            logger.info(f"Cleaning up task: task_id={task.task_id}")
+            self._active_ids.discard(task.task_id)
+            self._executors.pop(task.task_id, None)
+            self._task_futures.pop(task.task_id, None)
 
     async def shutdown(self) -> None:
         """Shutdown the task manager."""
-        # Cancel all running tasks
-        for task_id in list(self._tasks.keys()):
-            task = self._tasks[task_id]
-            if task.is_active:
-                await self.cancel_task(task_id)
+        # Cancel all running tasks concurrently, so shutdown takes as long as the
+        # slowest executor rather than the sum of all of them
+        active_tasks = [self._tasks[task_id] for task_id in self._active_ids]
+        if active_tasks:
+            results = await asyncio.gather(
+                *(self._cancel_active_task(task) for task in active_tasks), return_exceptions=True
+            )
+            for task, result in zip(active_tasks, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Failed to cancel task during shutdown: task_id={task.task_id}, error={result}"
+                    )
 
         # Wait for all futures to complete
         if self._task_futures:
-            await asyncio.gather(*self._task_futures.values(), return_exceptions=True)
+            await asyncio.gather(*list(self._task_futures.values()), return_exceptions=True)
+
+        # Stop the worker pool
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
 
     @property
     def active_task_count(self) -> int:
         """Get number of active tasks."""
-        return sum(1 for task in self._tasks.values() if task.is_active)
+        return len(self._active_ids)
 
     @property
     def total_task_count(self) -> int:
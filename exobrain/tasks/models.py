@@ -4,7 +4,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 class TaskStatus(str, Enum):
@@ -25,7 +25,12 @@ class TaskType(str, Enum):
     PROCESS = "process"
 
 
-@dataclass
+# Value -> member lookup tables, avoiding EnumMeta.__call__ on hot parsing paths
+_TASK_TYPE_MAP: Dict[str, TaskType] = {t.value: t for t in TaskType}
+_TASK_STATUS_MAP: Dict[str, TaskStatus] = {s.value: s for s in TaskStatus}
+
+
+@dataclass(slots=True)
 class Task:
     """Task data model."""
 
@@ -65,6 +70,33 @@ class Task:
     # Metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Field name -> (datetime, its isoformat), reused while the datetime is unchanged
+    _iso_cache: Dict[str, Tuple[datetime, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def _isoformat(self, name: str, value: Optional[datetime]) -> Optional[str]:
+        """
+        Format a datetime field, reusing the previous result if the field wasn't reassigned.
+
+        Args:
+            name: Field name
+            value: Current field value
+
+        Returns:
+            ISO 8601 string, or None if value is None
+        """
+        if value is None:
+            return None
+
+        cached = self._iso_cache.get(name)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+
+        iso = value.isoformat()
+        self._iso_cache[name] = (value, iso)
+        return iso
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert task to dictionary.
@@ -81,9 +113,9 @@ class Task:
             "status": self.status.value,
             "progress": self.progress,
             "error": self.error,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self._isoformat("created_at", self.created_at),
+            "started_at": self._isoformat("started_at", self.started_at),
+            "completed_at": self._isoformat("completed_at", self.completed_at),
             "iterations": self.iterations,
             "max_iterations": self.max_iterations,
             "command": self.command,
@@ -106,22 +138,21 @@ class Task:
         Returns:
             Task instance
         """
-        # Parse enums
-        task_type = TaskType(data.get("task_type", TaskType.AGENT.value))
-        status = TaskStatus(data.get("status", TaskStatus.PENDING.value))
+        # Parse enums, constructing them only to raise for unknown values
+        task_type = data.get("task_type", TaskType.AGENT.value)
+        task_type = _TASK_TYPE_MAP.get(task_type) or TaskType(task_type)
+        status = data.get("status", TaskStatus.PENDING.value)
+        status = _TASK_STATUS_MAP.get(status) or TaskStatus(status)
 
         # Parse datetimes
-        created_at = None
-        if data.get("created_at"):
-            created_at = datetime.fromisoformat(data["created_at"])
+        created_at = data.get("created_at")
+        created_at = datetime.fromisoformat(created_at) if created_at else None
 
-        started_at = None
-        if data.get("started_at"):
-            started_at = datetime.fromisoformat(data["started_at"])
+        started_at = data.get("started_at")
+        started_at = datetime.fromisoformat(started_at) if started_at else None
 
-        completed_at = None
-        if data.get("completed_at"):
-            completed_at = datetime.fromisoformat(data["completed_at"])
+        completed_at = data.get("completed_at")
+        completed_at = datetime.fromisoformat(completed_at) if completed_at else None
 
         return cls(
             task_id=data.get("task_id", ""),
@@ -1,9 +1,11 @@
 """Task monitoring and metrics collection."""
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Deque, Dict, List, Optional
 
 from .models import Task, TaskStatus, TaskType
 from .storage import TaskStorage
@@ -104,6 +106,9 @@ class TaskMonitor:
     and provides insights into task system performance.
     """
 
+    # Health checks reuse a metrics snapshot younger than this many seconds
+    METRICS_MAX_AGE = 5.0
+
     def __init__(
         self,
         storage: TaskStorage,
@@ -118,13 +123,15 @@ class TaskMonitor:
         """
         self.storage = storage
         self.max_concurrent_tasks = max_concurrent_tasks
-        self._metrics_history: List[TaskMetrics] = []
         self._max_history_size = 100
+        self._metrics_history: Deque[TaskMetrics] = deque(maxlen=self._max_history_size)
+        self._last_metrics: Optional[TaskMetrics] = None
 
     async def collect_metrics(
         self,
         active_task_count: int = 0,
         task_queue_size: int = 0,
+        max_age: Optional[float] = None,
     ) -> TaskMetrics:
         """
         Collect current task metrics.
@@ -132,14 +139,26 @@ class TaskMonitor:
         Args:
             active_task_count: Number of currently active tasks
             task_queue_size: Number of tasks waiting in queue
+            max_age: Return the last snapshot instead if it was collected for the
+                same task counts less than this many seconds ago
 
         Returns:
             TaskMetrics instance
         """
+        last = self._last_metrics
+        if (
+            max_age is not None
+            and last is not None
+            and last.active_task_count == active_task_count
+            and last.task_queue_size == task_queue_size
+            and (datetime.now() - last.collected_at).total_seconds() < max_age
+        ):
+            return last
+
         logger.debug("Collecting task metrics")
 
-        # Load all tasks
-        all_tasks = await self.storage.list_tasks()
+        # Counts are maintained by storage, recent activity comes from its sorted timestamps
+        counts = await self.storage.get_task_counts()
 
         # Initialize metrics
         metrics = TaskMetrics(
@@ -148,55 +167,31 @@ class TaskMonitor:
             task_queue_size=task_queue_size,
         )
 
-        # Count tasks by status
-        status_counts = {status: 0 for status in TaskStatus}
-        type_counts = {task_type: 0 for task_type in TaskType}
-        durations = []
-
         # Time window for recent activity (1 hour)
-        one_hour_ago = datetime.now() - timedelta(hours=1)
-
-        for task in all_tasks:
-            # Count by status
-            status_counts[task.status] += 1
-
-            # Count by type
-            type_counts[task.task_type] += 1
-
-            # Collect durations for completed tasks
-            if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED):
-                duration = task.duration
-                if duration:
-                    durations.append(duration)
-
-            # Count recent activity
-            if task.created_at and task.created_at > one_hour_ago:
-                metrics.tasks_created_last_hour += 1
-
-            if task.completed_at and task.completed_at > one_hour_ago:
-                if task.status == TaskStatus.COMPLETED:
-                    metrics.tasks_completed_last_hour += 1
-                elif task.status == TaskStatus.FAILED:
-                    metrics.tasks_failed_last_hour += 1
+        (
+            metrics.tasks_created_last_hour,
+            metrics.tasks_completed_last_hour,
+            metrics.tasks_failed_last_hour,
+        ) = await self.storage.count_recent(datetime.now() - timedelta(hours=1))
 
         # Set status counts
-        metrics.total_tasks = len(all_tasks)
-        metrics.pending_tasks = status_counts[TaskStatus.PENDING]
-        metrics.running_tasks = status_counts[TaskStatus.RUNNING]
-        metrics.completed_tasks = status_counts[TaskStatus.COMPLETED]
-        metrics.failed_tasks = status_counts[TaskStatus.FAILED]
-        metrics.cancelled_tasks = status_counts[TaskStatus.CANCELLED]
-        metrics.interrupted_tasks = status_counts[TaskStatus.INTERRUPTED]
+        metrics.total_tasks = sum(counts.status.values())
+        metrics.pending_tasks = counts.status[TaskStatus.PENDING.value]
+        metrics.running_tasks = counts.status[TaskStatus.RUNNING.value]
+        metrics.completed_tasks = counts.status[TaskStatus.COMPLETED.value]
+        metrics.failed_tasks = counts.status[TaskStatus.FAILED.value]
+        metrics.cancelled_tasks = counts.status[TaskStatus.CANCELLED.value]
+        metrics.interrupted_tasks = counts.status[TaskStatus.INTERRUPTED.value]
 
         # Set type counts
-        metrics.agent_tasks = type_counts[TaskType.AGENT]
-        metrics.process_tasks = type_counts[TaskType.PROCESS]
+        metrics.agent_tasks = counts.task_type[TaskType.AGENT.value]
+        metrics.process_tasks = counts.task_type[TaskType.PROCESS.value]
 
         # Calculate duration metrics
-        if durations:
-            metrics.avg_duration_seconds = sum(durations) / len(durations)
-            metrics.min_duration_seconds = min(durations)
-            metrics.max_duration_seconds = max(durations)
+        if counts.duration_count:
+            metrics.avg_duration_seconds = counts.duration_sum / counts.duration_count
+            metrics.min_duration_seconds = counts.duration_min
+            metrics.max_duration_seconds = counts.duration_max
 
         # Calculate success/failure rates
         terminal_tasks = metrics.completed_tasks + metrics.failed_tasks + metrics.cancelled_tasks
@@ -206,8 +201,7 @@ class TaskMonitor:
 
         # Store in history
         self._metrics_history.append(metrics)
-        if len(self._metrics_history) > self._max_history_size:
-            self._metrics_history.pop(0)
+        self._last_metrics = metrics
 
         logger.debug(f"Collected metrics: {metrics.total_tasks} total tasks")
         return metrics
@@ -215,12 +209,14 @@ class TaskMonitor:
     async def check_health(
         self,
         active_task_count: int = 0,
+        metrics: Optional[TaskMetrics] = None,
     ) -> HealthStatus:
         """
         Check health of the task system.
 
         Args:
             active_task_count: Number of currently active tasks
+            metrics: Metrics snapshot to check; a recent one is reused or collected if omitted
 
         Returns:
             HealthStatus instance
@@ -236,17 +232,17 @@ class TaskMonitor:
             )
 
         # Check for stuck tasks (running for more than 24 hours)
-        running_tasks = await self.storage.list_tasks(status=TaskStatus.RUNNING)
         stuck_threshold = datetime.now() - timedelta(hours=24)
-
-        for task in running_tasks:
-            if task.started_at and task.started_at < stuck_threshold:
-                health.warnings.append(
-                    f"Task {task.task_id} has been running for more than 24 hours"
-                )
+        for info in await self.storage.list_running_started_before(stuck_threshold):
+            health.warnings.append(
+                f"Task {info['task_id']} has been running for more than 24 hours"
+            )
 
         # Check for high failure rate
-        metrics = await self.collect_metrics(active_task_count=active_task_count)
+        if metrics is None:
+            metrics = await self.collect_metrics(
+                active_task_count=active_task_count, max_age=self.METRICS_MAX_AGE
+            )
         if metrics.failure_rate > 0.5 and metrics.total_tasks > 10:
             health.warnings.append(
                 f"High failure rate: {metrics.failure_rate:.1%} of tasks are failing"
@@ -277,8 +273,9 @@ class TaskMonitor:
             List of TaskMetrics instances
         """
         if limit:
-            return self._metrics_history[-limit:]
-        return self._metrics_history.copy()
+            start = max(0, len(self._metrics_history) - limit)
+            return list(islice(self._metrics_history, start, None))
+        return list(self._metrics_history)
 
     async def get_task_statistics(self) -> Dict:
         """
@@ -344,13 +341,13 @@ class TaskMonitor:
         Returns:
             List of slow-running tasks
         """
-        running_tasks = await self.storage.list_tasks(status=TaskStatus.RUNNING)
-        slow_tasks = []
-
         threshold_time = datetime.now() - timedelta(seconds=threshold_seconds)
+        slow_tasks = []
 
-        for task in running_tasks:
-            if task.started_at and task.started_at < threshold_time:
+        # Only the slow tasks themselves need their metadata loaded
+        for info in await self.storage.list_running_started_before(threshold_time):
+            task = await self.storage.load_task(info["task_id"])
+            if task:
                 slow_tasks.append(task)
 
         return slow_tasks
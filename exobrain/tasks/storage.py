@@ -1,17 +1,220 @@
 """Task storage with file-based persistence."""
 
 import asyncio
-import json
+import bisect
+import heapq
+import math
+import operator
+import os
+import shutil
+import weakref
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from exobrain.utils import fastjson
 
 from .models import Task, TaskStatus
 
+# Statuses of finished tasks, counted in duration statistics and eligible for cleanup
+_TERMINAL_STATUSES = (
+    TaskStatus.COMPLETED.value,
+    TaskStatus.FAILED.value,
+    TaskStatus.CANCELLED.value,
+)
+
+# Statuses whose index entry is written to disk as soon as a task enters them
+_DURABLE_STATUSES = (TaskStatus.RUNNING.value, *_TERMINAL_STATUSES)
+
+# Files written into each task directory
+_TASK_FILES = ("metadata.json", "output.log", "events.jsonl")
+
+# Statuses whose tasks are kept sorted by a timestamp field, for recent activity
+# counts and stuck task checks
+_TIMELINE_FIELDS = {
+    TaskStatus.RUNNING.value: "started_at",
+    TaskStatus.COMPLETED.value: "completed_at",
+    TaskStatus.FAILED.value: "completed_at",
+}
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    """
+    Write a file atomically, so concurrent readers see either the old or new content.
+
+    Args:
+        path: File to write; its directory is created if missing
+        data: File content
+    """
+    tmp_file = path.with_name(path.name + ".tmp")
+    try:
+        tmp_file.write_bytes(data)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(data)
+    os.replace(tmp_file, path)
+
+
+def _append_file(path: Path, data: bytes) -> None:
+    """
+    Append to a file, creating it and its directory if missing.
+
+    Args:
+        path: File to append to
+        data: Content to append
+    """
+    try:
+        with open(path, "ab") as f:
+            f.write(data)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "ab") as f:
+            f.write(data)
+
+
+def _remove_task_dir(task_dir: Path) -> None:
+    """
+    Remove a task directory, unlinking the files tasks normally hold before rmtree.
+
+    Args:
+        task_dir: Task directory; missing files and directories are ignored
+    """
+    for name in _TASK_FILES:
+        try:
+            os.unlink(task_dir / name)
+        except FileNotFoundError:
+            pass
+
+    try:
+        os.rmdir(task_dir)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        # Something else is in there, such as a leftover temporary file
+        shutil.rmtree(task_dir, ignore_errors=True)
+
+
+async def _write_in_thread(func: Callable[..., None], *args) -> None:
+    """
+    Run a blocking file write in a worker thread, waiting for it even if cancelled.
+
+    A cancelled to_thread() await returns while its thread keeps running, which would
+    let the next write of the same file start before this one is done.
+
+    Args:
+        func: Blocking write function
+        *args: Arguments passed to func
+    """
+    future = asyncio.ensure_future(asyncio.to_thread(func, *args))
+    try:
+        await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait((future,))
+        raise
+
+
+@dataclass
+class TaskCounts:
+    """Running task counts kept in step with the task index."""
+
+    # Task counts by status and type value
+    status: Counter = field(default_factory=Counter)
+    task_type: Counter = field(default_factory=Counter)
+
+    # Durations of completed, failed and cancelled tasks
+    duration_sum: float = 0.0
+    duration_count: int = 0
+    duration_min: float = math.inf
+    duration_max: float = 0.0
+
+    # Set when a removed duration was the min or max, which then need a rescan
+    extremes_stale: bool = False
+
+    @staticmethod
+    def _duration(info: Dict) -> Optional[float]:
+        """
+        Get the duration an index entry contributes to the statistics.
+
+        Args:
+            info: Task index entry
+
+        Returns:
+            Duration in seconds, or None if the entry does not count
+        """
+        if info.get("status") in _TERMINAL_STATUSES:
+            return info.get("duration") or None
+        return None
+
+    def add(self, info: Dict) -> None:
+        """
+        Count a task index entry.
+
+        Args:
+            info: Task index entry
+        """
+        self.status[info.get("status")] += 1
+        self.task_type[info.get("task_type")] += 1
+
+        duration = self._duration(info)
+        if duration is not None:
+            self.duration_sum += duration
+            self.duration_count += 1
+            self.duration_min = min(self.duration_min, duration)
+            self.duration_max = max(self.duration_max, duration)
+
+    def remove(self, info: Dict) -> None:
+        """
+        Stop counting a task index entry.
+
+        Args:
+            info: Task index entry that was previously added
+        """
+        self.status[info.get("status")] -= 1
+        self.task_type[info.get("task_type")] -= 1
+
+        duration = self._duration(info)
+        if duration is not None:
+            self.duration_sum -= duration
+            self.duration_count -= 1
+            if duration <= self.duration_min or duration >= self.duration_max:
+                self.extremes_stale = True
+
+    def rescan_extremes(self, index: Dict[str, Dict]) -> None:
+        """
+        Recompute the duration min and max from the index.
+
+        Args:
+            index: Task index dictionary
+        """
+        durations = [d for d in map(self._duration, index.values()) if d is not None]
+        self.duration_min = min(durations, default=math.inf)
+        self.duration_max = max(durations, default=0.0)
+        self.extremes_stale = False
+
 
 class TaskStorage:
     """File-based task storage."""
 
+    # Maximum number of task directories removed in parallel during cleanup
+    CLEANUP_CONCURRENCY = 32
+
+    # Index changes within this many seconds are written to disk together
+    INDEX_FLUSH_DELAY = 0.05
+
+    # Number of task metadata files read per worker thread hop while listing
+    LOAD_BATCH_SIZE = 32
+
+    # Buffered events are appended to disk after this many seconds...
+    EVENT_FLUSH_DELAY = 0.1
+
+    # ...or as soon as a task's buffer reaches this many bytes
+    EVENT_BUFFER_SIZE = 64 * 1024
+
+    # Assumed bytes per event when reading the last few events from the end of the file
+    EVENT_TAIL_LINE_SIZE = 512
+
     def __init__(self, storage_path: str = "~/.exobrain/data/tasks"):
         """
         Initialize task storage.
@@ -21,7 +224,35 @@ class TaskStorage:
         """
         self.storage_path = Path(storage_path).expanduser()
         self.index_file = self.storage_path / "tasks_index.json"
-        self._lock = asyncio.Lock()
+
+        # Index is read from disk once, then kept in memory and flushed lazily
+        self._index: Optional[Dict[str, Dict]] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Future] = None
+
+        # File I/O runs in worker threads; per-task locks keep each task's writes in call order
+        self._task_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+        # Task IDs partitioned by status and type value, kept in step with the index
+        self._by_status: Dict[str, Set[str]] = defaultdict(set)
+        self._by_type: Dict[str, Set[str]] = defaultdict(set)
+
+        # (created_ts, task_id) of every indexed task, oldest first
+        self._order: List[Tuple[float, str]] = []
+
+        # (timestamp, task_id) of tasks by status for statuses in _TIMELINE_FIELDS, oldest first
+        self._timelines: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+
+        # Built from the index on first use, then updated on every index change
+        self._counts: Optional[TaskCounts] = None
+
+        # Encoded events per task waiting to be appended, with their total size
+        self._event_buffers: Dict[str, List[bytes]] = {}
+        self._event_buffer_sizes: Dict[str, int] = {}
+        self._events_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._event_writes: Set[asyncio.Future] = set()
 
     async def initialize(self) -> None:
         """Initialize storage directory and index."""
@@ -30,7 +261,25 @@ class TaskStorage:
 
         # Create index file if it doesn't exist
         if not self.index_file.exists():
-            await self._write_index({})
+            self._set_index({})
+            _replace_file(self.index_file, b"{}")
+
+        await self.get_task_counts()
+
+    def _task_lock(self, task_id: str) -> asyncio.Lock:
+        """
+        Get the lock serializing file writes of a task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Lock shared by everyone currently writing files of the task
+        """
+        lock = self._task_locks.get(task_id)
+        if lock is None:
+            lock = self._task_locks[task_id] = asyncio.Lock()
+        return lock
 
     def _get_task_dir(self, task_id: str) -> Path:
         """
@@ -85,53 +334,338 @@ class TaskStorage:
         Read task index.
 
         Returns:
-            Task index dictionary
+            The in-memory task index, loaded from disk on first use
+        """
+        if self._index is None:
+            if self.index_file.exists():
+                with open(self.index_file, "rb") as f:
+                    self._set_index(fastjson.loads(f.read()))
+            else:
+                self._set_index({})
+
+        return self._index
+
+    def _set_index(self, index: Dict[str, Dict]) -> None:
+        """
+        Replace the in-memory index and rebuild the status and type partitions.
+
+        Args:
+            index: Task index dictionary
         """
-        async with self._lock:
-            if not self.index_file.exists():
-                return {}
+        self._index = index
+        self._by_status.clear()
+        self._by_type.clear()
+        self._timelines.clear()
+        for task_id, info in index.items():
+            if "created_ts" not in info:
+                # Entries written before creation timestamps were indexed
+                created_at = info.get("created_at")
+                info["created_ts"] = (
+                    datetime.fromisoformat(created_at).timestamp() if created_at else None
+                )
+            self._by_status[info.get("status")].add(task_id)
+            self._by_type[info.get("task_type")].add(task_id)
+            timeline_key = self._timeline_key(info)
+            if timeline_key:
+                self._timelines[info["status"]].append(timeline_key)
+        self._order = sorted(self._order_key(info) for info in index.values())
+        for timeline in self._timelines.values():
+            timeline.sort()
+
+    @staticmethod
+    def _order_key(info: Dict) -> Tuple[float, str]:
+        """
+        Get the creation order key of an index entry.
 
-            with open(self.index_file, "r") as f:
-                return json.load(f)
+        Args:
+            info: Task index entry
+
+        Returns:
+            Tuple of (creation timestamp, task_id)
+        """
+        return (info.get("created_ts") or 0.0, info["task_id"])
+
+    @staticmethod
+    def _timeline_key(info: Dict) -> Optional[Tuple[str, str]]:
+        """
+        Get the key of an index entry in the timeline of its status.
+
+        Args:
+            info: Task index entry
+
+        Returns:
+            Tuple of (timestamp, task_id), or None if the status has no timeline
+            or the timestamp is not set
+        """
+        time_field = _TIMELINE_FIELDS.get(info.get("status"))
+        if time_field and info.get(time_field):
+            return (info[time_field], info["task_id"])
+        return None
+
+    def _timeline_remove(self, info: Dict) -> None:
+        """
+        Remove an index entry from the timeline of its status.
+
+        Args:
+            info: Task index entry
+        """
+        key = self._timeline_key(info)
+        if key:
+            timeline = self._timelines[info["status"]]
+            del timeline[bisect.bisect_left(timeline, key)]
+
+    def _index_put(self, index: Dict[str, Dict], entry: Dict) -> None:
+        """
+        Add or replace an index entry, updating partitions and counts.
+
+        Args:
+            index: Task index dictionary
+            entry: Task index entry
+        """
+        task_id = entry["task_id"]
+        previous = index.get(task_id)
+        index[task_id] = entry
+
+        key = self._order_key(entry)
+        if previous is not None:
+            self._by_status[previous.get("status")].discard(task_id)
+            self._by_type[previous.get("task_type")].discard(task_id)
+            if self._counts is not None:
+                self._counts.remove(previous)
+
+            previous_key = self._order_key(previous)
+            if previous_key != key:
+                del self._order[bisect.bisect_left(self._order, previous_key)]
+                bisect.insort(self._order, key)
+            self._timeline_remove(previous)
+        elif not self._order or key > self._order[-1]:
+            # New tasks are normally the newest
+            self._order.append(key)
+        else:
+            bisect.insort(self._order, key)
+
+        self._by_status[entry.get("status")].add(task_id)
+        self._by_type[entry.get("task_type")].add(task_id)
+        timeline_key = self._timeline_key(entry)
+        if timeline_key:
+            bisect.insort(self._timelines[entry["status"]], timeline_key)
+        if self._counts is not None:
+            self._counts.add(entry)
+
+    def _index_pop(self, index: Dict[str, Dict], task_id: str) -> Dict:
+        """
+        Remove an index entry, updating partitions and counts.
+
+        Args:
+            index: Task index dictionary
+            task_id: Task ID present in the index
+
+        Returns:
+            The removed index entry
+        """
+        info = index.pop(task_id)
+        self._by_status[info.get("status")].discard(task_id)
+        self._by_type[info.get("task_type")].discard(task_id)
+        del self._order[bisect.bisect_left(self._order, self._order_key(info))]
+        self._timeline_remove(info)
+        if self._counts is not None:
+            self._counts.remove(info)
+        return info
 
     async def _write_index(self, index: Dict[str, Dict]) -> None:
         """
         Write task index.
 
+        The index is replaced in memory right away and written to disk after
+        INDEX_FLUSH_DELAY, so bursts of changes cost a single file write. Changes
+        still pending when the process dies are lost, so save_task() writes the
+        index through when a task becomes running or finishes; only newly created
+        tasks and progress updates can be dropped from the index by a crash.
+
         Args:
             index: Task index dictionary
         """
-        async with self._lock:
-            with open(self.index_file, "w") as f:
-                json.dump(index, f, indent=2)
+        if index is not self._index:
+            self._set_index(index)
 
-    async def save_task(self, task: Task) -> None:
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.INDEX_FLUSH_DELAY, self._flush_index)
+
+    def _flush_index(self) -> None:
+        """Snapshot the in-memory index and write it to disk from a worker thread."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if self._index is None:
+            return
+
+        # Serialize on the loop for a consistent snapshot; only the write is offloaded
+        data = fastjson.dumps_bytes(self._index)
+        self._flush_task = asyncio.ensure_future(self._write_index_file(data, self._flush_task))
+
+    async def _write_index_file(self, data: bytes, previous: Optional[asyncio.Future]) -> None:
         """
-        Save task to storage.
+        Write an index snapshot once the previous snapshot has been written.
 
         Args:
-            task: Task to save
+            data: Serialized index
+            previous: Write of the previous snapshot, if any
         """
-        # Create task directory
-        task_dir = self._get_task_dir(task.task_id)
-        task_dir.mkdir(parents=True, exist_ok=True)
+        if previous is not None and not previous.done():
+            await asyncio.wait((previous,))
+        await _write_in_thread(_replace_file, self.index_file, data)
+
+    async def flush(self) -> None:
+        """Write pending index changes and buffered events to disk now."""
+        if self._flush_handle is not None:
+            self._flush_index()
+        self._flush_all_events()
+        if self._event_writes:
+            await asyncio.gather(*self._event_writes)
+        if self._flush_task is not None:
+            await self._flush_task
+
+    @staticmethod
+    def _index_entry(task: Task, data: Dict, previous: Optional[Dict] = None) -> Dict:
+        """
+        Build the index entry for a task.
 
-        # Save metadata
-        metadata_file = self._get_metadata_file(task.task_id)
-        with open(metadata_file, "w") as f:
-            json.dump(task.to_dict(), f, indent=2)
+        Args:
+            task: Task to index
+            data: The task's to_dict(), whose formatted timestamps are reused
+            previous: Current index entry of the task, if any
 
-        # Update index
-        index = await self._read_index()
-        index[task.task_id] = {
+        Returns:
+            Task index entry
+        """
+        # Tasks are saved on every status change, but their creation time never moves
+        created_at = data["created_at"]
+        if previous is not None and previous.get("created_at") == created_at:
+            created_ts = previous.get("created_ts")
+        else:
+            created_ts = task.created_at.timestamp() if task.created_at else None
+
+        return {
             "task_id": task.task_id,
             "name": task.name,
             "task_type": task.task_type.value,
             "status": task.status.value,
-            "created_at": task.created_at.isoformat() if task.created_at else None,
+            "created_at": created_at,
+            "created_ts": created_ts,
+            "started_at": data["started_at"],
+            "completed_at": data["completed_at"],
+            "duration": task.duration if task.is_terminal else None,
             "updated_at": datetime.now().isoformat(),
         }
+
+    async def get_task_counts(self) -> TaskCounts:
+        """
+        Get running task counts without loading any task metadata.
+
+        Returns:
+            TaskCounts kept up to date by later saves and deletes; callers must not modify it
+        """
+        if self._counts is None:
+            index = await self._read_index()
+
+            # Index entries written before timings were indexed need their metadata once
+            migrated = False
+            for task_id, info in list(index.items()):
+                if "started_at" not in info:
+                    task = await self.load_task(task_id)
+                    if task:
+                        entry = self._index_entry(task, task.to_dict(), info)
+                        entry["updated_at"] = info.get("updated_at")
+                        info.update(entry)
+                    else:
+                        info.update(started_at=None, completed_at=None, duration=None)
+                    migrated = True
+            if migrated:
+                # Migrated entries gained completion times the partitions must reflect
+                self._set_index(index)
+                await self._write_index(index)
+
+            counts = TaskCounts()
+            for info in index.values():
+                counts.add(info)
+            self._counts = counts
+        elif self._counts.extremes_stale:
+            self._counts.rescan_extremes(await self._read_index())
+
+        return self._counts
+
+    async def count_recent(self, since: datetime) -> Tuple[int, int, int]:
+        """
+        Count tasks created, completed and failed after a point in time.
+
+        Args:
+            since: Start of the time window
+
+        Returns:
+            Tuple of (created, completed, failed) task counts
+        """
+        await self._read_index()
+        first = operator.itemgetter(0)
+        created = len(self._order) - bisect.bisect_right(self._order, since.timestamp(), key=first)
+
+        # ISO timestamps from the same clock compare in time order as strings
+        since_iso = since.isoformat()
+        completed, failed = (
+            len(timeline) - bisect.bisect_right(timeline, since_iso, key=first)
+            for timeline in (
+                self._timelines[TaskStatus.COMPLETED.value],
+                self._timelines[TaskStatus.FAILED.value],
+            )
+        )
+        return created, completed, failed
+
+    async def list_running_started_before(self, cutoff: datetime) -> List[Dict]:
+        """
+        List index entries of running tasks started before a point in time.
+
+        Args:
+            cutoff: Tasks started at or after this time are left out
+
+        Returns:
+            Copies of the task index entries, longest running first
+        """
+        index = await self._read_index()
+        timeline = self._timelines[TaskStatus.RUNNING.value]
+        end = bisect.bisect_left(timeline, cutoff.isoformat(), key=operator.itemgetter(0))
+        # Copy so callers can't corrupt the index, partitions or timelines
+        return [dict(index[task_id]) for _, task_id in timeline[:end]]
+
+    async def save_task(self, task: Task) -> None:
+        """
+        Save task to storage.
+
+        Args:
+            task: Task to save
+        """
+        # Snapshot the task on the loop, then write the metadata off it
+        task_dict = task.to_dict()
+        data = fastjson.dumps_bytes(task_dict, indent=True)
+        previous = (await self._read_index()).get(task.task_id)
+        entry = self._index_entry(task, task_dict, previous)
+
+        # Readers of a finished task should see all of its events
+        if task.is_terminal:
+            await self.flush_events(task.task_id)
+
+        async with self._task_lock(task.task_id):
+            await _write_in_thread(_replace_file, self._get_metadata_file(task.task_id), data)
+
+        # Update index
+        index = await self._read_index()
+        self._index_put(index, entry)
         await self._write_index(index)
+        status = entry["status"]
+        if status in _DURABLE_STATUSES and (previous is None or previous["status"] != status):
+            # Don't let a crash drop a started or finished task from the index
+            self._flush_index()
+            await self._flush_task
 
         # Set output paths
         task.output_path = str(self._get_output_file(task.task_id))
@@ -147,14 +681,41 @@ class TaskStorage:
         Returns:
             Task instance, or None if not found
         """
-        metadata_file = self._get_metadata_file(task_id)
-        if not metadata_file.exists():
+        return await asyncio.to_thread(self._load_task_sync, task_id)
+
+    def _load_task_sync(self, task_id: str) -> Optional[Task]:
+        """
+        Load task from storage, blocking; metadata is replaced atomically so any thread may read it.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Task instance, or None if not found
+        """
+        try:
+            data = self._get_metadata_file(task_id).read_bytes()
+        except FileNotFoundError:
             return None
 
-        with open(metadata_file, "r") as f:
-            data = json.load(f)
+        return Task.from_dict(fastjson.loads(data))
+
+    def _load_tasks_sync(self, task_ids: List[str]) -> List[Task]:
+        """
+        Load several tasks from storage, blocking, skipping any that are missing.
 
-        return Task.from_dict(data)
+        Args:
+            task_ids: Task IDs
+
+        Returns:
+            Loaded tasks, in the given order
+        """
+        tasks = []
+        for task_id in task_ids:
+            task = self._load_task_sync(task_id)
+            if task:
+                tasks.append(task)
+        return tasks
 
     async def delete_task(self, task_id: str) -> bool:
         """
@@ -171,15 +732,13 @@ class TaskStorage:
         if task_id not in index:
             return False
 
-        del index[task_id]
+        self._index_pop(index, task_id)
         await self._write_index(index)
+        self._drop_events(task_id)
 
-        # Remove task directory
-        task_dir = self._get_task_dir(task_id)
-        if task_dir.exists():
-            import shutil
-
-            shutil.rmtree(task_dir)
+        # Remove task directory, waiting for writes already under way
+        async with self._task_lock(task_id):
+            await _write_in_thread(_remove_task_dir, self._get_task_dir(task_id))
 
         return True
 
@@ -200,32 +759,59 @@ class TaskStorage:
         Returns:
             List of tasks
         """
-        index = await self._read_index()
+        return [task async for task in self.iter_tasks(status, task_type, limit)]
 
-        # Filter tasks
-        task_ids = []
-        for task_id, info in index.items():
-            if status and info.get("status") != status.value:
-                continue
-            if task_type and info.get("task_type") != task_type:
-                continue
-            task_ids.append(task_id)
+    async def iter_tasks(
+        self,
+        status: Optional[TaskStatus] = None,
+        task_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Task]:
+        """
+        Iterate over tasks from storage, loading each one lazily.
 
-        # Sort by creation time (newest first)
-        task_ids.sort(key=lambda tid: index[tid].get("created_at", ""), reverse=True)
+        Args:
+            status: Filter by status
+            task_type: Filter by task type
+            limit: Maximum number of tasks to yield
 
-        # Apply limit
-        if limit:
-            task_ids = task_ids[:limit]
+        Yields:
+            Tasks, newest first
+        """
+        index = await self._read_index()
 
-        # Load tasks
-        tasks = []
-        for task_id in task_ids:
-            task = await self.load_task(task_id)
-            if task:
-                tasks.append(task)
+        if status or task_type:
+            # Filter tasks through the status and type partitions
+            if status and task_type:
+                candidates = self._by_status.get(status.value, set()) & self._by_type.get(
+                    task_type, set()
+                )
+            elif status:
+                candidates = self._by_status.get(status.value, ())
+            else:
+                candidates = self._by_type.get(task_type, ())
+
+            # Order only the matches by creation time (newest first)
+            def key(task_id: str) -> Tuple[float, str]:
+                return self._order_key(index[task_id])
 
-        return tasks
+            if limit:
+                task_ids = heapq.nlargest(limit, candidates, key=key)
+            else:
+                task_ids = sorted(candidates, key=key, reverse=True)
+        else:
+            # All tasks are already kept in creation order
+            order = self._order[-limit:] if limit else self._order
+            task_ids = [task_id for _, task_id in reversed(order)]
+
+        # Load tasks in batches, one worker thread hop per batch
+        for start in range(0, len(task_ids), self.LOAD_BATCH_SIZE):
+            batch = task_ids[start : start + self.LOAD_BATCH_SIZE]
+            for task in await asyncio.to_thread(self._load_tasks_sync, batch):
+                # The task may have changed status since the index was filtered
+                if status and task.status != status:
+                    continue
+                yield task
 
     async def append_output(self, task_id: str, output: str) -> None:
         """
@@ -235,16 +821,28 @@ class TaskStorage:
             task_id: Task ID
             output: Output text to append
         """
-        output_file = self._get_output_file(task_id)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, "a") as f:
-            f.write(output)
+        data = output.encode("utf-8")
+        async with self._task_lock(task_id):
+            await _write_in_thread(_append_file, self._get_output_file(task_id), data)
 
     async def read_output(self, task_id: str, offset: int = 0, limit: Optional[int] = None) -> str:
         """
         Read output from task output file.
 
+        Args:
+            task_id: Task ID
+            offset: Byte offset to start reading from
+            limit: Maximum number of bytes to read
+
+        Returns:
+            Output text
+        """
+        return await asyncio.to_thread(self._read_output_sync, task_id, offset, limit)
+
+    def _read_output_sync(self, task_id: str, offset: int, limit: Optional[int]) -> str:
+        """
+        Read output from task output file, blocking.
+
         Args:
             task_id: Task ID
             offset: Byte offset to start reading from
@@ -267,18 +865,66 @@ class TaskStorage:
         """
         Append event to task events file.
 
+        Events are buffered in memory and appended after EVENT_FLUSH_DELAY, or
+        once EVENT_BUFFER_SIZE bytes are pending, so chatty tasks cost a few
+        file writes rather than one per event.
+
         Args:
             task_id: Task ID
             event: Event dictionary
         """
-        events_file = self._get_events_file(task_id)
-        events_file.parent.mkdir(parents=True, exist_ok=True)
-
         # Add timestamp
         event["timestamp"] = datetime.now().isoformat()
 
-        with open(events_file, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        data = fastjson.dumps_bytes(event) + b"\n"
+        self._event_buffers.setdefault(task_id, []).append(data)
+        size = self._event_buffer_sizes.get(task_id, 0) + len(data)
+        self._event_buffer_sizes[task_id] = size
+
+        if size >= self.EVENT_BUFFER_SIZE:
+            await self.flush_events(task_id)
+        elif self._events_flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._events_flush_handle = loop.call_later(
+                self.EVENT_FLUSH_DELAY, self._flush_all_events
+            )
+
+    async def flush_events(self, task_id: str) -> None:
+        """
+        Append the buffered events of a task to its events file now.
+
+        Args:
+            task_id: Task ID
+        """
+        chunks = self._event_buffers.pop(task_id, None)
+        self._event_buffer_sizes.pop(task_id, None)
+        if not chunks:
+            return
+
+        # The task lock is FIFO, so buffers flushed one after another land in order
+        async with self._task_lock(task_id):
+            await _write_in_thread(_append_file, self._get_events_file(task_id), b"".join(chunks))
+
+    def _flush_all_events(self) -> None:
+        """Start appending the buffered events of every task."""
+        if self._events_flush_handle is not None:
+            self._events_flush_handle.cancel()
+            self._events_flush_handle = None
+
+        for task_id in list(self._event_buffers):
+            future = asyncio.ensure_future(self.flush_events(task_id))
+            self._event_writes.add(future)
+            future.add_done_callback(self._event_writes.discard)
+
+    def _drop_events(self, task_id: str) -> None:
+        """
+        Discard the buffered events of a deleted task.
+
+        Args:
+            task_id: Task ID
+        """
+        self._event_buffers.pop(task_id, None)
+        self._event_buffer_sizes.pop(task_id, None)
 
     async def read_events(self, task_id: str, limit: Optional[int] = None) -> List[Dict]:
         """
@@ -291,21 +937,62 @@ class TaskStorage:
         Returns:
             List of event dictionaries
         """
-        events_file = self._get_events_file(task_id)
-        if not events_file.exists():
-            return []
+        await self.flush_events(task_id)
+        return await asyncio.to_thread(self._read_events_sync, task_id, limit)
+
+    def _read_events_sync(self, task_id: str, limit: Optional[int]) -> List[Dict]:
+        """
+        Read events from task events file, blocking.
 
-        events = []
-        with open(events_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    events.append(json.loads(line))
+        Args:
+            task_id: Task ID
+            limit: Maximum number of events to return (most recent)
 
-        # Return most recent events if limit specified
+        Returns:
+            List of event dictionaries
+        """
         if limit:
-            events = events[-limit:]
+            return self._read_events_tail(task_id, limit)
+
+        try:
+            data = self._get_events_file(task_id).read_bytes()
+        except FileNotFoundError:
+            return []
+
+        return [fastjson.loads(line) for line in data.splitlines() if line.strip()]
+
+    def _read_events_tail(self, task_id: str, limit: int) -> List[Dict]:
+        """
+        Read the most recent events from a window at the end of the events file, widened as needed.
 
-        return events
+        Args:
+            task_id: Task ID
+            limit: Number of events to return
+
+        Returns:
+            List of event dictionaries
+        """
+        try:
+            f = open(self._get_events_file(task_id), "rb")
+        except FileNotFoundError:
+            return []
+
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            window = limit * self.EVENT_TAIL_LINE_SIZE
+            while True:
+                start = max(0, size - window)
+                f.seek(start)
+                lines = f.read(size - start).splitlines()
+                # The first line of a window that starts mid-file may be partial
+                if start > 0:
+                    lines = lines[1:]
+                lines = [line for line in lines if line.strip()]
+                if len(lines) >= limit or start == 0:
+                    break
+                window *= 2
+
+        return [fastjson.loads(line) for line in lines[-limit:]]
 
     async def cleanup_old_tasks(self, retention_days: int = 30, max_tasks: int = 1000) -> int:
         """
@@ -320,43 +1007,55 @@ class TaskStorage:
         """
         index = await self._read_index()
 
-        # Get all completed tasks
-        completed_tasks = []
-        for task_id, info in index.items():
-            if info.get("status") in (
-                TaskStatus.COMPLETED.value,
-                TaskStatus.FAILED.value,
-                TaskStatus.CANCELLED.value,
-            ):
-                completed_tasks.append((task_id, info))
-
-        # Sort by creation time (oldest first)
-        completed_tasks.sort(key=lambda x: x[1].get("created_at", ""))
+        # Get all completed tasks, oldest first
+        completed_tasks = [
+            (task_id, index[task_id])
+            for _, task_id in self._order
+            if index[task_id].get("status") in _TERMINAL_STATUSES
+        ]
 
-        # Determine tasks to delete
-        tasks_to_delete = []
+        # Determine tasks to delete (a dict keeps them ordered and unique)
+        tasks_to_delete: Dict[str, None] = {}
 
         # Delete tasks older than retention period
         cutoff_date = datetime.now().timestamp() - (retention_days * 86400)
         for task_id, info in completed_tasks:
-            created_at = info.get("created_at")
-            if created_at:
-                created_timestamp = datetime.fromisoformat(created_at).timestamp()
-                if created_timestamp < cutoff_date:
-                    tasks_to_delete.append(task_id)
+            created_ts = info.get("created_ts")
+            if created_ts and created_ts < cutoff_date:
+                tasks_to_delete[task_id] = None
 
         # Delete excess tasks if over max_tasks
         total_tasks = len(index)
         if total_tasks > max_tasks:
             excess = total_tasks - max_tasks
             for task_id, _ in completed_tasks[:excess]:
-                if task_id not in tasks_to_delete:
-                    tasks_to_delete.append(task_id)
+                tasks_to_delete[task_id] = None
+
+        await self._bulk_delete(list(tasks_to_delete))
+        return len(tasks_to_delete)
+
+    async def _bulk_delete(self, task_ids: List[str]) -> None:
+        """
+        Delete many tasks with a single index update.
+
+        Args:
+            task_ids: IDs of tasks present in the index
+        """
+        if not task_ids:
+            return
+
+        # Drop all of them from the index with a single rewrite
+        index = await self._read_index()
+        for task_id in task_ids:
+            self._index_pop(index, task_id)
+            self._drop_events(task_id)
+        await self._write_index(index)
+
+        # Remove task directories concurrently, removal is blocking I/O
+        semaphore = asyncio.Semaphore(self.CLEANUP_CONCURRENCY)
 
-        # Delete tasks
-        deleted_count = 0
-        for task_id in tasks_to_delete:
-            if await self.delete_task(task_id):
-                deleted_count += 1
+        async def remove_task_dir(task_id: str) -> None:
+            async with semaphore:
+                await _write_in_thread(_remove_task_dir, self._get_task_dir(task_id))
 
-        return deleted_count
+        await asyncio.gather(*(remove_task_dir(task_id) for task_id in task_ids))
@@ -1,9 +1,13 @@
 """Base classes for transport abstraction layer."""
 
+import struct
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any, Dict
 
+# Big-endian 4-byte length prefix framing each message on stream transports
+LENGTH_PREFIX = struct.Struct("!I")
+
 
 class TransportType(str, Enum):
     """Transport type enumeration."""
@@ -1,193 +1,221 @@
 """Transport factory with platform auto-detection."""
 
-import platform
-from typing import Any, Dict, Optional
+import importlib.util
+import sys
+from functools import cache
+from typing import Any, Callable, Dict, Optional
 
 from .base import Transport, TransportServer, TransportType
 from .named_pipe import NamedPipeServer, NamedPipeTransport
 from .unix_socket import UnixSocketServer, UnixSocketTransport
 
-# Conditionally import HTTP transport
-try:
-    from .http import HTTPServer, HTTPTransport
+# Default configuration of each transport type, also filling in missing config keys
+_DEFAULT_CONFIGS: Dict[TransportType, Dict[str, Any]] = {
+    TransportType.UNIX: {"socket_path": "~/.exobrain/task-daemon.sock"},
+    TransportType.PIPE: {"pipe_name": r"\\.\pipe\exobrain-task-daemon"},
+    TransportType.HTTP: {
+        "host": "localhost",
+        "port": 8765,
+        "enable_remote": False,
+        "auth_token": None,
+    },
+}
+
+
+@cache
+def _http_available() -> bool:
+    """
+    Check whether the HTTP transport can be used, without importing aiohttp.
+
+    The HTTP transport module is only imported once an HTTP transport is
+    created, so processes using other transports never load aiohttp.
+
+    Returns:
+        True if aiohttp is installed
+    """
+    return importlib.util.find_spec("aiohttp") is not None
+
+
+def _require_http() -> None:
+    """Raise ImportError if the HTTP transport cannot be used."""
+    if not _http_available():
+        raise ImportError(
+            "aiohttp is required for HTTP transport. " "Install it with: pip install aiohttp"
+        )
+
+
+def _create_http_transport(config: Dict[str, Any]) -> Transport:
+    """
+    Create a client-side HTTP transport.
+
+    Args:
+        config: HTTP configuration with defaults filled in
+
+    Returns:
+        HTTPTransport instance
+    """
+    _require_http()
+    from .http import HTTPTransport
+
+    return HTTPTransport(config["host"], config["port"], config["auth_token"])
+
+
+def _create_http_server(config: Dict[str, Any]) -> TransportServer:
+    """
+    Create a server-side HTTP transport.
+
+    Args:
+        config: HTTP configuration with defaults filled in
+
+    Returns:
+        HTTPServer instance
+    """
+    _require_http()
+    from .http import HTTPServer
+
+    return HTTPServer(config["host"], config["port"], config["enable_remote"], config["auth_token"])
+
+
+# Constructors of each transport type, called with the config merged over its defaults
+_TRANSPORT_BUILDERS: Dict[TransportType, Callable[[Dict[str, Any]], Transport]] = {
+    TransportType.UNIX: lambda config: UnixSocketTransport(config["socket_path"]),
+    TransportType.PIPE: lambda config: NamedPipeTransport(config["pipe_name"]),
+    TransportType.HTTP: _create_http_transport,
+}
+_SERVER_BUILDERS: Dict[TransportType, Callable[[Dict[str, Any]], TransportServer]] = {
+    TransportType.UNIX: lambda config: UnixSocketServer(config["socket_path"]),
+    TransportType.PIPE: lambda config: NamedPipeServer(config["pipe_name"]),
+    TransportType.HTTP: _create_http_server,
+}
+
+
+def detect_platform_transport() -> TransportType:
+    """
+    Detect the best transport type for the current platform.
+
+    Returns:
+        TransportType enum value
+    """
+    if sys.platform in ("linux", "darwin"):  # Linux or macOS
+        return TransportType.UNIX
+    elif sys.platform == "win32":
+        return TransportType.PIPE
+    else:
+        # Fallback to HTTP for unknown platforms
+        return TransportType.HTTP
+
+
+def create_transport(
+    transport_type: TransportType = TransportType.AUTO, config: Optional[Dict[str, Any]] = None
+) -> Transport:
+    """
+    Create a client-side transport instance.
 
-    HTTP_AVAILABLE = True
-except ImportError:
-    HTTP_AVAILABLE = False
-    HTTPTransport = None
-    HTTPServer = None
+    Args:
+        transport_type: Type of transport to create (AUTO for auto-detection)
+        config: Transport-specific configuration
+
+    Returns:
+        Transport instance
+
+    Raises:
+        ValueError: If transport type is invalid or not supported
+    """
+    # Auto-detect if needed
+    if transport_type == TransportType.AUTO:
+        transport_type = detect_platform_transport()
+
+    builder = _TRANSPORT_BUILDERS.get(transport_type)
+    if builder is None:
+        raise ValueError(f"Unsupported transport type: {transport_type}")
+    return builder({**_DEFAULT_CONFIGS[transport_type], **(config or {})})
+
+
+def create_server(
+    transport_type: TransportType = TransportType.AUTO, config: Optional[Dict[str, Any]] = None
+) -> TransportServer:
+    """
+    Create a server-side transport instance.
+
+    Args:
+        transport_type: Type of transport to create (AUTO for auto-detection)
+        config: Transport-specific configuration
+
+    Returns:
+        TransportServer instance
+
+    Raises:
+        ValueError: If transport type is invalid or not supported
+    """
+    # Auto-detect if needed
+    if transport_type == TransportType.AUTO:
+        transport_type = detect_platform_transport()
+
+    builder = _SERVER_BUILDERS.get(transport_type)
+    if builder is None:
+        raise ValueError(f"Unsupported transport type: {transport_type}")
+    return builder({**_DEFAULT_CONFIGS[transport_type], **(config or {})})
+
+
+def get_default_config(transport_type: TransportType = TransportType.AUTO) -> Dict[str, Any]:
+    """
+    Get default configuration for a transport type.
+
+    Args:
+        transport_type: Type of transport (AUTO for auto-detection)
+
+    Returns:
+        Default configuration dictionary
+    """
+    # Auto-detect if needed
+    if transport_type == TransportType.AUTO:
+        transport_type = detect_platform_transport()
+
+    defaults = _DEFAULT_CONFIGS.get(transport_type)
+    if defaults is None:
+        raise ValueError(f"Unsupported transport type: {transport_type}")
+
+    # Values are immutable, so a shallow copy keeps the templates intact
+    return dict(defaults)
+
+
+def is_transport_available(transport_type: TransportType) -> bool:
+    """
+    Check if a transport type is available on the current platform.
+
+    Args:
+        transport_type: Type of transport to check
+
+    Returns:
+        True if transport is available, False otherwise
+    """
+    if transport_type == TransportType.AUTO:
+        return True
+
+    if transport_type == TransportType.UNIX:
+        # Unix sockets available on Linux and macOS
+        return sys.platform in ("linux", "darwin")
+
+    elif transport_type == TransportType.PIPE:
+        # Named pipes available on Windows, through the Proactor event loop
+        return sys.platform == "win32"
+
+    elif transport_type == TransportType.HTTP:
+        # HTTP available on all platforms (requires aiohttp)
+        return _http_available()
+
+    return False
 
 
 class TransportFactory:
-    """Factory for creating transport instances with platform auto-detection."""
-
-    @staticmethod
-    def detect_platform_transport() -> TransportType:
-        """
-        Detect the best transport type for the current platform.
-
-        Returns:
-            TransportType enum value
-        """
-        system = platform.system()
-
-        if system in ("Linux", "Darwin"):  # Linux or macOS
-            return TransportType.UNIX
-        elif system == "Windows":
-            return TransportType.PIPE
-        else:
-            # Fallback to HTTP for unknown platforms
-            return TransportType.HTTP
-
-    @staticmethod
-    def create_transport(
-        transport_type: TransportType = TransportType.AUTO, config: Optional[Dict[str, Any]] = None
-    ) -> Transport:
-        """
-        Create a client-side transport instance.
-
-        Args:
-            transport_type: Type of transport to create (AUTO for auto-detection)
-            config: Transport-specific configuration
-
-        Returns:
-            Transport instance
-
-        Raises:
-            ValueError: If transport type is invalid or not supported
-        """
-        config = config or {}
-
-        # Auto-detect if needed
-        if transport_type == TransportType.AUTO:
-            transport_type = TransportFactory.detect_platform_transport()
-
-        # Create transport based on type
-        if transport_type == TransportType.UNIX:
-            socket_path = config.get("socket_path", "~/.exobrain/task-daemon.sock")
-            return UnixSocketTransport(socket_path)
-
-        elif transport_type == TransportType.PIPE:
-            pipe_name = config.get("pipe_name", r"\\.\pipe\exobrain-task-daemon")
-            return NamedPipeTransport(pipe_name)
-
-        elif transport_type == TransportType.HTTP:
-            if not HTTP_AVAILABLE:
-                raise ImportError(
-                    "aiohttp is required for HTTP transport. "
-                    "Install it with: pip install aiohttp"
-                )
-            host = config.get("host", "localhost")
-            port = config.get("port", 8765)
-            auth_token = config.get("auth_token")
-            return HTTPTransport(host, port, auth_token)
-
-        else:
-            raise ValueError(f"Unsupported transport type: {transport_type}")
-
-    @staticmethod
-    def create_server(
-        transport_type: TransportType = TransportType.AUTO, config: Optional[Dict[str, Any]] = None
-    ) -> TransportServer:
-        """
-        Create a server-side transport instance.
-
-        Args:
-            transport_type: Type of transport to create (AUTO for auto-detection)
-            config: Transport-specific configuration
-
-        Returns:
-            TransportServer instance
-
-        Raises:
-            ValueError: If transport type is invalid or not supported
-        """
-        config = config or {}
-
-        # Auto-detect if needed
-        if transport_type == TransportType.AUTO:
-            transport_type = TransportFactory.detect_platform_transport()
-
-        # Create server based on type
-        if transport_type == TransportType.UNIX:
-            socket_path = config.get("socket_path", "~/.exobrain/task-daemon.sock")
-            return UnixSocketServer(socket_path)
-
-        elif transport_type == TransportType.PIPE:
-            pipe_name = config.get("pipe_name", r"\\.\pipe\exobrain-task-daemon")
-            return NamedPipeServer(pipe_name)
-
-        elif transport_type == TransportType.HTTP:
-            if not HTTP_AVAILABLE:
-                raise ImportError(
-                    "aiohttp is required for HTTP transport. "
-                    "Install it with: pip install aiohttp"
-                )
-            host = config.get("host", "localhost")
-            port = config.get("port", 8765)
-            enable_remote = config.get("enable_remote", False)
-            auth_token = config.get("auth_token")
-            return HTTPServer(host, port, enable_remote, auth_token)
-
-        else:
-            raise ValueError(f"Unsupported transport type: {transport_type}")
-
-    @staticmethod
-    def get_default_config(transport_type: TransportType = TransportType.AUTO) -> Dict[str, Any]:
-        """
-        Get default configuration for a transport type.
-
-        Args:
-            transport_type: Type of transport (AUTO for auto-detection)
-
-        Returns:
-            Default configuration dictionary
-        """
-        # Auto-detect if needed
-        if transport_type == TransportType.AUTO:
-            transport_type = TransportFactory.detect_platform_transport()
-
-        if transport_type == TransportType.UNIX:
-            return {"socket_path": "~/.exobrain/task-daemon.sock"}
-
-        elif transport_type == TransportType.PIPE:
-            return {"pipe_name": r"\\.\pipe\exobrain-task-daemon"}
-
-        elif transport_type == TransportType.HTTP:
-            return {"host": "localhost", "port": 8765, "enable_remote": False, "auth_token": None}
-
-        else:
-            raise ValueError(f"Unsupported transport type: {transport_type}")
-
-    @staticmethod
-    def is_transport_available(transport_type: TransportType) -> bool:
-        """
-        Check if a transport type is available on the current platform.
-
-        Args:
-            transport_type: Type of transport to check
-
-        Returns:
-            True if transport is available, False otherwise
-        """
-        if transport_type == TransportType.AUTO:
-            return True
-
-        if transport_type == TransportType.UNIX:
-            # Unix sockets available on Linux and macOS
-            return platform.system() in ("Linux", "Darwin")
-
-        elif transport_type == TransportType.PIPE:
-            # Named pipes available on Windows (requires pywin32)
-            if platform.system() != "Windows":
-                return False
-            try:
-                return True
-            except ImportError:
-                return False
-
-        elif transport_type == TransportType.HTTP:
-            # HTTP available on all platforms (requires aiohttp)
-            return HTTP_AVAILABLE
-
-        return False
+    """
+    Factory for creating transport instances with platform auto-detection.
+
+    Kept for existing callers; the module-level functions can be called directly.
+    """
+
+    detect_platform_transport = staticmethod(detect_platform_transport)
+    create_transport = staticmethod(create_transport)
+    create_server = staticmethod(create_server)
+    get_default_config = staticmethod(get_default_config)
+    is_transport_available = staticmethod(is_transport_available)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hmac
 import json
 from typing import Any, Dict, Optional
 
@@ -15,12 +16,27 @@ except ImportError:
     aiohttp = None  # type: ignore
     web = None  # type: ignore
 
+from exobrain.utils import fastjson
+
 from .base import Transport, TransportServer
 
+# Bodies of the server's constant responses, serialized once
+_HEALTH_BODY = b'{"status":"ok"}'
+_MISSING_AUTH_BODY = b'{"status":"error","error":"Missing authentication"}'
+_INVALID_AUTH_BODY = b'{"status":"error","error":"Invalid authentication"}'
+
 
 class HTTPTransport(Transport):
     """Client-side HTTP transport."""
 
+    # Kept-alive connections reused across requests
+    MAX_CONNECTIONS = 32
+    KEEPALIVE_TIMEOUT = 60.0
+
+    # Seconds allowed for the connect health check and for each request
+    CONNECT_TIMEOUT = 5.0
+    REQUEST_TIMEOUT = 30.0
+
     def __init__(self, host: str = "localhost", port: int = 8765, auth_token: Optional[str] = None):
         """
         Initialize HTTP transport.
@@ -41,14 +57,26 @@ class HTTPTransport(Transport):
         self.base_url = f"http://{host}:{port}"
         self._session: Optional[aiohttp.ClientSession] = None
 
+        # Every request goes to the same endpoint with the same headers
+        self._api_url = f"{self.base_url}/api/tasks"
+        self._headers = {"Content-Type": "application/json"}
+        if auth_token:
+            self._headers["Authorization"] = f"Bearer {auth_token}"
+
     async def connect(self) -> None:
         """Establish connection to the daemon."""
-        self._session = aiohttp.ClientSession()
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.MAX_CONNECTIONS, keepalive_timeout=self.KEEPALIVE_TIMEOUT
+            ),
+            headers=self._headers,
+            timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+        )
 
         # Test connection
         try:
             async with self._session.get(
-                f"{self.base_url}/health", timeout=aiohttp.ClientTimeout(total=5)
+                f"{self.base_url}/health", timeout=aiohttp.ClientTimeout(total=self.CONNECT_TIMEOUT)
             ) as response:
                 if response.status != 200:
                     raise ConnectionError(f"Server returned status {response.status}")
@@ -76,21 +104,14 @@ class HTTPTransport(Transport):
         if not self.is_connected():
             raise ConnectionError("Not connected to daemon")
 
-        headers = {"Content-Type": "application/json"}
-        if self.auth_token:
-            headers["Authorization"] = f"Bearer {self.auth_token}"
-
         try:
             async with self._session.post(
-                f"{self.base_url}/api/tasks",
-                json=request,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30),
+                self._api_url, data=fastjson.dumps_bytes(request)
             ) as response:
                 if response.status == 401:
                     return {"status": "error", "error": "Authentication failed"}
 
-                response_data = await response.json()
+                response_data = await response.json(loads=fastjson.loads)
                 return response_data
 
         except aiohttp.ClientError as e:
@@ -129,6 +150,9 @@ class HTTPServer(TransportServer):
         self.port = port
         self.auth_token = auth_token
         self._app: Optional[web.Application] = None
+
+        # Authorization header clients must send, compared in constant time
+        self._expected_auth = f"Bearer {auth_token}".encode() if auth_token else None
         self._runner: Optional[web.AppRunner] = None
         self._site: Optional[web.TCPSite] = None
         self._request_handler = None
@@ -186,7 +210,7 @@ class HTTPServer(TransportServer):
         Returns:
             HTTP response
         """
-        return web.json_response({"status": "ok"})
+        return web.Response(body=_HEALTH_BODY, content_type="application/json")
 
     async def _handle_api_request(self, request: "web.Request") -> "web.Response":
         """
@@ -199,26 +223,25 @@ class HTTPServer(TransportServer):
             HTTP response
         """
         # Check authentication
-        if self.auth_token:
+        if self._expected_auth is not None:
             auth_header = request.headers.get("Authorization", "")
             if not auth_header.startswith("Bearer "):
-                return web.json_response(
-                    {"status": "error", "error": "Missing authentication"}, status=401
+                return web.Response(
+                    body=_MISSING_AUTH_BODY, status=401, content_type="application/json"
                 )
 
-            token = auth_header[7:]  # Remove "Bearer " prefix
-            if token != self.auth_token:
-                return web.json_response(
-                    {"status": "error", "error": "Invalid authentication"}, status=401
+            if not hmac.compare_digest(auth_header.encode(), self._expected_auth):
+                return web.Response(
+                    body=_INVALID_AUTH_BODY, status=401, content_type="application/json"
                 )
 
         # Parse request
         try:
-            request_data = await request.json()
+            request_data = await request.json(loads=fastjson.loads)
         except json.JSONDecodeError:
             return web.json_response({"status": "error", "error": "Invalid JSON"}, status=400)
 
         # Handle request
         response = await self.handle_request(request_data)
 
-        return web.json_response(response)
+        return web.json_response(response, dumps=fastjson.dumps)
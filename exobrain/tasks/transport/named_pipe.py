@@ -1,10 +1,34 @@
 """Named pipe transport implementation for Windows."""
 
 import asyncio
-import json
-from typing import Any, Dict, Optional
+import logging
+from typing import Any, Dict, List, Optional
 
-from .base import Transport, TransportServer
+from exobrain.utils import fastjson
+
+from .base import LENGTH_PREFIX, Transport, TransportServer
+
+logger = logging.getLogger(__name__)
+
+
+def _require_pipe_support(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Check that an event loop can serve and connect to named pipes.
+
+    Named pipes are driven by IOCP, which only the Proactor event loop
+    (the default on Windows) provides.
+
+    Args:
+        loop: Running event loop
+
+    Raises:
+        RuntimeError: If the loop has no named pipe support
+    """
+    if not hasattr(loop, "create_pipe_connection"):
+        raise RuntimeError(
+            "Named pipe transport requires the Proactor event loop on Windows, "
+            f"got {type(loop).__name__}"
+        )
 
 
 class NamedPipeTransport(Transport):
@@ -23,45 +47,27 @@ class NamedPipeTransport(Transport):
 
     async def connect(self) -> None:
         """Establish connection to the daemon."""
+        loop = asyncio.get_running_loop()
+        _require_pipe_support(loop)
+
+        # Wrap the overlapped pipe in streams, as asyncio.open_unix_connection does for sockets
+        reader = asyncio.StreamReader()
+        protocol = asyncio.StreamReaderProtocol(reader)
         try:
-            import pywintypes
-            import win32file
-        except ImportError:
-            raise ImportError(
-                "pywin32 is required for Named pipe transport on Windows. "
-                "Install it with: pip install pywin32"
-            )
-
-        # Open named pipe
-        try:
-            handle = win32file.CreateFile(
-                self.pipe_name,
-                win32file.GENERIC_READ | win32file.GENERIC_WRITE,
-                0,
-                None,
-                win32file.OPEN_EXISTING,
-                0,
-                None,
-            )
-        except pywintypes.error as e:
+            transport, _ = await loop.create_pipe_connection(lambda: protocol, self.pipe_name)
+        except OSError as e:
             raise ConnectionError(f"Failed to connect to pipe {self.pipe_name}: {e}")
 
-        # Create asyncio streams from pipe handle
-        # Note: This is a simplified implementation
-        # In production, we'd need proper async pipe handling
-        self._handle = handle
-        self._connected = True
+        self._reader = reader
+        self._writer = asyncio.StreamWriter(transport, protocol, reader, loop)
 
     async def disconnect(self) -> None:
         """Close connection to the daemon."""
-        if hasattr(self, "_handle"):
-            try:
-                import win32file
-
-                win32file.CloseHandle(self._handle)
-            except Exception:
-                pass
-            self._connected = False
+        if self._writer:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+            self._reader = None
 
     async def send_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -76,34 +82,27 @@ class NamedPipeTransport(Transport):
         if not self.is_connected():
             raise ConnectionError("Not connected to daemon")
 
-        try:
-            import win32file
-        except ImportError:
-            raise ImportError("pywin32 is required for Named pipe transport")
-
         # Serialize request
-        request_data = json.dumps(request).encode("utf-8")
+        request_data = fastjson.dumps_bytes(request)
         request_length = len(request_data)
 
-        # Send length prefix (4 bytes) + data
-        message = request_length.to_bytes(4, "big") + request_data
-
-        # Write to pipe
-        win32file.WriteFile(self._handle, message)
+        # Send length prefix (4 bytes) + data in a single write
+        self._writer.writelines((LENGTH_PREFIX.pack(request_length), request_data))
+        await self._writer.drain()
 
         # Read response length prefix
-        _, length_bytes = win32file.ReadFile(self._handle, 4)
-        response_length = int.from_bytes(length_bytes, "big")
+        length_bytes = await self._reader.readexactly(LENGTH_PREFIX.size)
+        response_length = LENGTH_PREFIX.unpack(length_bytes)[0]
 
         # Read response data
-        _, response_data = win32file.ReadFile(self._handle, response_length)
-        response = json.loads(response_data.decode("utf-8"))
+        response_data = await self._reader.readexactly(response_length)
+        response = fastjson.loads(response_data)
 
         return response
 
     def is_connected(self) -> bool:
         """Check if transport is connected."""
-        return hasattr(self, "_connected") and self._connected
+        return self._writer is not None and not self._writer.is_closing()
 
 
 class NamedPipeServer(TransportServer):
@@ -117,33 +116,26 @@ class NamedPipeServer(TransportServer):
             pipe_name: Name of the pipe (e.g., r"\\.\pipe\exobrain-task-daemon")
         """
         self.pipe_name = pipe_name
-        self._running = False
         self._request_handler = None
-        self._server_task: Optional[asyncio.Task] = None
+
+        # Pipe servers returned by the event loop, each accepting clients on its own
+        self._servers: List[Any] = []
 
     async def start(self) -> None:
         """Start the transport server."""
-        try:
-            pass
-        except ImportError:
-            raise ImportError(
-                "pywin32 is required for Named pipe transport on Windows. "
-                "Install it with: pip install pywin32"
-            )
+        loop = asyncio.get_running_loop()
+        _require_pipe_support(loop)
 
-        self._running = True
-        self._server_task = asyncio.create_task(self._run_server())
+        def protocol_factory() -> asyncio.StreamReaderProtocol:
+            return asyncio.StreamReaderProtocol(asyncio.StreamReader(), self._handle_client)
+
+        self._servers = await loop.start_serving_pipe(protocol_factory, self.pipe_name)
 
     async def stop(self) -> None:
         """Stop the transport server."""
-        self._running = False
-        if self._server_task:
-            self._server_task.cancel()
-            try:
-                await self._server_task
-            except asyncio.CancelledError:
-                pass
-            self._server_task = None
+        for server in self._servers:
+            server.close()
+        self._servers = []
 
     async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -159,81 +151,45 @@ class NamedPipeServer(TransportServer):
 
     def is_running(self) -> bool:
         """Check if server is running."""
-        return self._running
+        return bool(self._servers)
 
-    async def _run_server(self) -> None:
-        """Run the named pipe server loop."""
-        try:
-            import pywintypes
-            import win32pipe
-        except ImportError:
-            raise ImportError("pywin32 is required for Named pipe transport")
-
-        while self._running:
-            try:
-                # Create named pipe
-                pipe = win32pipe.CreateNamedPipe(
-                    self.pipe_name,
-                    win32pipe.PIPE_ACCESS_DUPLEX,
-                    win32pipe.PIPE_TYPE_MESSAGE
-                    | win32pipe.PIPE_READMODE_MESSAGE
-                    | win32pipe.PIPE_WAIT,
-                    win32pipe.PIPE_UNLIMITED_INSTANCES,
-                    65536,
-                    65536,
-                    0,
-                    None,
-                )
-
-                # Wait for client connection
-                win32pipe.ConnectNamedPipe(pipe, None)
-
-                # Handle client in background
-                asyncio.create_task(self._handle_client(pipe))
-
-            except pywintypes.error as e:
-                if self._running:
-                    print(f"Error in pipe server: {e}")
-                    await asyncio.sleep(1)
-
-    async def _handle_client(self, pipe) -> None:
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
         """
         Handle a client connection.
 
         Args:
-            pipe: Pipe handle
+            reader: Stream reader
+            writer: Stream writer
         """
         try:
-            import win32file
-        except ImportError:
-            return
-
-        try:
-            while self._running:
+            while True:
                 # Read request length prefix
-                _, length_bytes = win32file.ReadFile(pipe, 4)
-                request_length = int.from_bytes(length_bytes, "big")
+                length_bytes = await reader.readexactly(LENGTH_PREFIX.size)
+                request_length = LENGTH_PREFIX.unpack(length_bytes)[0]
 
                 # Read request data
-                _, request_data = win32file.ReadFile(pipe, request_length)
-                request = json.loads(request_data.decode("utf-8"))
+                request_data = await reader.readexactly(request_length)
+                request = fastjson.loads(request_data)
 
                 # Handle request
                 response = await self.handle_request(request)
 
                 # Serialize response
-                response_data = json.dumps(response).encode("utf-8")
+                response_data = fastjson.dumps_bytes(response)
                 response_length = len(response_data)
 
-                # Send length prefix + data
-                message = response_length.to_bytes(4, "big") + response_data
-                win32file.WriteFile(pipe, message)
+                # Send length prefix + data in a single write
+                writer.writelines((LENGTH_PREFIX.pack(response_length), response_data))
+                await writer.drain()
 
-        except Exception as e:
-            if self._running:
-                print(f"Error handling client: {e}")
+        except (asyncio.IncompleteReadError, ConnectionResetError, BrokenPipeError):
+            # Client disconnected
+            pass
+        except Exception:
+            # Log error but don't crash server
+            logger.exception("Error handling client")
         finally:
-            try:
-                win32file.CloseHandle(pipe)
-            except Exception:
-                pass
+            writer.close()
+            await writer.wait_closed()
@@ -1,12 +1,15 @@
 """Unix socket transport implementation for Linux/macOS."""
 
 import asyncio
-import json
+import logging
 import os
-from pathlib import Path
 from typing import Any, Dict, Optional
 
-from .base import Transport, TransportServer
+from exobrain.utils import fastjson
+
+from .base import LENGTH_PREFIX, Transport, TransportServer
+
+logger = logging.getLogger(__name__)
 
 
 class UnixSocketTransport(Transport):
@@ -19,16 +22,17 @@ class UnixSocketTransport(Transport):
         Args:
             socket_path: Path to Unix socket file
         """
-        self.socket_path = Path(socket_path).expanduser()
+        # Expanded once; asyncio and os take the path as a string
+        self.socket_path = os.path.expanduser(socket_path)
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
 
     async def connect(self) -> None:
         """Establish connection to the daemon."""
-        if not self.socket_path.exists():
-            raise ConnectionError(f"Socket file not found: {self.socket_path}")
-
-        self._reader, self._writer = await asyncio.open_unix_connection(str(self.socket_path))
+        try:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.socket_path)
+        except FileNotFoundError as e:
+            raise ConnectionError(f"Socket file not found: {self.socket_path}") from e
 
     async def disconnect(self) -> None:
         """Close connection to the daemon."""
@@ -52,21 +56,20 @@ class UnixSocketTransport(Transport):
             raise ConnectionError("Not connected to daemon")
 
         # Serialize request
-        request_data = json.dumps(request).encode("utf-8")
+        request_data = fastjson.dumps_bytes(request)
         request_length = len(request_data)
 
-        # Send length prefix (4 bytes) + data
-        self._writer.write(request_length.to_bytes(4, "big"))
-        self._writer.write(request_data)
+        # Send length prefix (4 bytes) + data in a single write
+        self._writer.writelines((LENGTH_PREFIX.pack(request_length), request_data))
         await self._writer.drain()
 
         # Read response length prefix
-        length_bytes = await self._reader.readexactly(4)
-        response_length = int.from_bytes(length_bytes, "big")
+        length_bytes = await self._reader.readexactly(LENGTH_PREFIX.size)
+        response_length = LENGTH_PREFIX.unpack(length_bytes)[0]
 
         # Read response data
         response_data = await self._reader.readexactly(response_length)
-        response = json.loads(response_data.decode("utf-8"))
+        response = fastjson.loads(response_data)
 
         return response
 
@@ -85,21 +88,23 @@ class UnixSocketServer(TransportServer):
         Args:
             socket_path: Path to Unix socket file
         """
-        self.socket_path = Path(socket_path).expanduser()
+        # Expanded once; asyncio and os take the path as a string
+        self.socket_path = os.path.expanduser(socket_path)
         self._server: Optional[asyncio.Server] = None
         self._request_handler = None
 
     async def start(self) -> None:
         """Start the transport server."""
         # Remove existing socket file if it exists
-        if self.socket_path.exists():
-            self.socket_path.unlink()
+        self._remove_socket_file()
 
-        # Ensure parent directory exists
-        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directory exists (none to create for a bare file name)
+        parent = os.path.dirname(self.socket_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
 
         # Start Unix socket server
-        self._server = await asyncio.start_unix_server(self._handle_client, str(self.socket_path))
+        self._server = await asyncio.start_unix_server(self._handle_client, self.socket_path)
 
         # Set socket permissions (owner only)
         os.chmod(self.socket_path, 0o600)
@@ -112,8 +117,14 @@ class UnixSocketServer(TransportServer):
             self._server = None
 
         # Clean up socket file
-        if self.socket_path.exists():
-            self.socket_path.unlink()
+        self._remove_socket_file()
+
+    def _remove_socket_file(self) -> None:
+        """Remove the socket file if it exists."""
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
 
     async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -144,31 +155,30 @@ class UnixSocketServer(TransportServer):
         try:
             while True:
                 # Read request length prefix
-                length_bytes = await reader.readexactly(4)
-                request_length = int.from_bytes(length_bytes, "big")
+                length_bytes = await reader.readexactly(LENGTH_PREFIX.size)
+                request_length = LENGTH_PREFIX.unpack(length_bytes)[0]
 
                 # Read request data
                 request_data = await reader.readexactly(request_length)
-                request = json.loads(request_data.decode("utf-8"))
+                request = fastjson.loads(request_data)
 
                 # Handle request
                 response = await self.handle_request(request)
 
                 # Serialize response
-                response_data = json.dumps(response).encode("utf-8")
+                response_data = fastjson.dumps_bytes(response)
                 response_length = len(response_data)
 
-                # Send length prefix + data
-                writer.write(response_length.to_bytes(4, "big"))
-                writer.write(response_data)
+                # Send length prefix + data in a single write
+                writer.writelines((LENGTH_PREFIX.pack(response_length), response_data))
                 await writer.drain()
 
         except asyncio.IncompleteReadError:
             # Client disconnected
             pass
-        except Exception as e:
+        except Exception:
             # Log error but don't crash server
-            print(f"Error handling client: {e}")
+            logger.exception("Error handling client")
         finally:
             writer.close()
             await writer.wait_closed()
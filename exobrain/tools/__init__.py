@@ -1,31 +1,56 @@
 """Tool modules for ExoBrain.
 
-This module imports all tool implementations to trigger @register_tool decorators.
-Tools are automatically discovered and registered via the decorator pattern.
+Tool implementations register themselves with @register_tool when imported.
+Importing this package does not import them, since some pull in heavy
+dependencies; each ``exobrain.tools.<module>`` is loaded on first access, and
+register_all() imports every module so all tools get registered.
 """
 
-# Import all tool modules to trigger registration
+import importlib
+from types import ModuleType
+
 # NOTE: Import order doesn't matter, but we organize by category for clarity
-from exobrain.tools import context7_tools  # Context7 search integration
-from exobrain.tools import file_tools  # File system operations
-from exobrain.tools import location_tools  # Location services
-from exobrain.tools import math_tools  # Mathematical evaluation
-from exobrain.tools import pdf_tools  # PDF processing
-from exobrain.tools import shell_tools  # Shell command execution and OS info
-from exobrain.tools import skill_tools  # Skill management tools
-from exobrain.tools import task_tools  # Task management tools
-from exobrain.tools import time_tools  # Time and timezone tools
-from exobrain.tools import web_tools  # Web search and fetch
-
-__all__ = [
-    "context7_tools",
-    "file_tools",
-    "location_tools",
-    "math_tools",
-    "pdf_tools",
-    "shell_tools",
-    "skill_tools",
-    "task_tools",
-    "time_tools",
-    "web_tools",
-]
+_SUBMODULES = (
+    "context7_tools",  # Context7 search integration
+    "file_tools",  # File system operations
+    "location_tools",  # Location services
+    "math_tools",  # Mathematical evaluation
+    "pdf_tools",  # PDF processing
+    "shell_tools",  # Shell command execution and OS info
+    "skill_tools",  # Skill management tools
+    "task_tools",  # Task management tools
+    "time_tools",  # Time and timezone tools
+    "web_tools",  # Web search and fetch
+)
+
+__all__ = [*_SUBMODULES, "register_all"]
+
+
+def register_all() -> None:
+    """Import all tool modules to trigger their @register_tool decorators."""
+    for name in _SUBMODULES:
+        importlib.import_module(f"{__name__}.{name}")
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a tool module on first attribute access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The imported tool module
+
+    Raises:
+        AttributeError: If name is not a tool module
+    """
+    if name in _SUBMODULES:
+        # Importing a submodule also binds it as an attribute of this package,
+        # so __getattr__ is not called for it again
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including tool modules not imported yet."""
+    return sorted({*globals(), *_SUBMODULES})
@@ -0,0 +1,41 @@
+"""JSON helpers that use orjson when it is installed and fall back to the stdlib."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+
+    def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes, indented by two spaces if indent."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(data: str | bytes) -> Any:
+        """Deserialize JSON from a string or UTF-8 encoded bytes."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes, indented by two spaces if indent."""
+        return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return json.dumps(obj)
+
+    def loads(data: str | bytes) -> Any:
+        """Deserialize JSON from a string or UTF-8 encoded bytes."""
+        return json.loads(data)
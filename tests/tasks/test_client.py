@@ -1,8 +1,14 @@
 """Tests for TaskClient."""
 
+import os
+import subprocess
+import sys
+import time
+
 import pytest
 
 from exobrain.tasks import DaemonConnectionError, DaemonNotRunningError, TaskClient, TransportType
+from exobrain.tasks.client import _is_process_running, _read_proc_stat
 
 # Configure pytest-anyio
 pytestmark = pytest.mark.anyio
@@ -79,6 +85,32 @@ async def test_send_request_not_connected(client):
         await client.ping()
 
 
+@pytest.mark.anyio
+async def test_failed_version_restart_keeps_transport(client, monkeypatch):
+    """Test a failed auto-restart on version mismatch still leaves the client connected."""
+
+    class FakeTransport:
+        async def send_request(self, request):
+            return {"status": "ok", "data": {"version": "0.0.0-old", "running_task_count": 0}}
+
+        async def disconnect(self):
+            pass
+
+    async def open_transport():
+        client._transport = FakeTransport()
+
+    async def failing_restart(timeout):
+        raise RuntimeError("daemon did not restart")
+
+    monkeypatch.setattr(client, "_open_transport", open_transport)
+    monkeypatch.setattr(client, "restart_daemon", failing_restart)
+
+    client._transport = FakeTransport()
+    await client._check_version_compatibility()
+
+    assert client._transport is not None
+
+
 def test_client_config():
     """Test client configuration."""
     client = TaskClient(
@@ -96,3 +128,54 @@ def test_client_config():
     assert client.auto_start is True
     assert client.max_retries == 5
     assert client.retry_delay == 1.0
+
+
+def test_read_pid_file_formats(client):
+    """Test PID file parsing for JSON, legacy and malformed content."""
+    client.pid_file.parent.mkdir(parents=True, exist_ok=True)
+
+    client.pid_file.write_text('{"pid": 1234, "version": "0.0.1"}')
+    assert client._read_pid_file() == {"pid": 1234, "version": "0.0.1"}
+
+    client.pid_file.write_text("1234\n")
+    assert client._read_pid_file() == {"pid": 1234, "version": None}
+
+    client.pid_file.write_text("{not json")
+    assert client._read_pid_file() is None
+
+    client.pid_file.write_text("garbage")
+    assert client._read_pid_file() is None
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="procfs not available")
+def test_exited_unreaped_process_not_running():
+    """Test an exited but unreaped (zombie) child is reported as not running."""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    try:
+        # Wait for the child to exit without reaping it
+        deadline = time.time() + 10
+        while _is_process_running(process.pid) and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert not _is_process_running(process.pid)
+    finally:
+        process.wait()
+
+    assert _is_process_running(os.getpid())
+
+
+def test_reaped_process_not_running():
+    """Test a PID whose process has exited and been reaped is not running."""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+
+    assert not _is_process_running(process.pid)
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="procfs not available")
+def test_read_proc_stat():
+    """Test /proc/<pid>/stat parsing past the command name."""
+    fields = _read_proc_stat(os.getpid())
+    assert fields is not None
+    assert fields[0] == "R"
+    assert int(fields[1]) == os.getppid()
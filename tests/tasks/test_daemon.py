@@ -1,6 +1,9 @@
 """Tests for TaskDaemon."""
 
+import asyncio
 import os
+import signal
+import sys
 from pathlib import Path
 
 import pytest
@@ -191,3 +194,288 @@ async def test_daemon_list_tasks(daemon):
 
     finally:
         await daemon.stop()
+
+
+@pytest.mark.anyio
+async def test_daemon_hello(daemon):
+    """Test hello handshake reports version and running task count."""
+    from exobrain import __version__
+
+    await daemon.start()
+
+    try:
+        response = await daemon._handle_request({"action": "hello", "params": {}})
+        assert response["status"] == "ok"
+        assert response["data"]["version"] == __version__
+        assert response["data"]["running_task_count"] == 0
+
+    finally:
+        await daemon.stop()
+
+
+@pytest.mark.anyio
+async def test_daemon_batch(daemon):
+    """Test batch requests are handled in order."""
+    await daemon.start()
+
+    try:
+        response = await daemon._handle_request(
+            {
+                "action": "batch",
+                "params": {
+                    "requests": [
+                        {"action": "ping", "params": {}},
+                        {"action": "get_task", "params": {"task_id": "missing"}},
+                        {"action": "batch", "params": {"requests": []}},
+                    ]
+                },
+            }
+        )
+
+        assert response["status"] == "ok"
+        results = response["data"]["results"]
+        assert len(results) == 3
+        assert results[0]["data"]["message"] == "pong"
+        assert results[1]["status"] == "error"
+        assert "Nested batch" in results[2]["error"]
+
+    finally:
+        await daemon.stop()
+
+
+@pytest.mark.anyio
+async def test_daemon_coalesces_identical_read_requests(daemon, monkeypatch):
+    """Test concurrent identical read-only requests share one computation."""
+    await daemon.start()
+
+    try:
+        calls = 0
+        original = daemon._handle_get_statistics
+
+        async def slow_statistics(params):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return await original(params)
+
+        monkeypatch.setattr(daemon, "_handle_get_statistics", slow_statistics)
+
+        request = {"action": "get_statistics", "params": {}}
+        responses = await asyncio.gather(*(daemon._handle_request(request) for _ in range(5)))
+
+        assert calls == 1
+        assert all(r["status"] == "ok" for r in responses)
+        assert not daemon._inflight
+
+    finally:
+        await daemon.stop()
+
+
+@pytest.mark.anyio
+async def test_daemon_coalesced_leader_cancel_reruns_for_followers(daemon, monkeypatch):
+    """Test a follower still gets a response when the leader request is cancelled."""
+    await daemon.start()
+
+    try:
+        calls = 0
+        original = daemon._handle_get_statistics
+
+        async def slow_statistics(params):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return await original(params)
+
+        monkeypatch.setattr(daemon, "_handle_get_statistics", slow_statistics)
+
+        request = {"action": "get_statistics", "params": {}}
+        leader = asyncio.create_task(daemon._handle_request(request))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(daemon._handle_request(request))
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        response = await follower
+        assert response["status"] == "ok"
+        assert calls == 2
+        assert not daemon._inflight
+
+    finally:
+        await daemon.stop()
+
+
+@pytest.mark.anyio
+async def test_daemon_coalesced_responses_are_copies(daemon, monkeypatch):
+    """Test coalesced callers don't share one response object."""
+    await daemon.start()
+
+    try:
+        original = daemon._handle_get_statistics
+
+        async def slow_statistics(params):
+            await asyncio.sleep(0.05)
+            return await original(params)
+
+        monkeypatch.setattr(daemon, "_handle_get_statistics", slow_statistics)
+
+        request = {"action": "get_statistics", "params": {}}
+        first, second = await asyncio.gather(
+            daemon._handle_request(request), daemon._handle_request(request)
+        )
+
+        assert first == second
+        assert first is not second
+        assert first["data"] is not second["data"]
+
+    finally:
+        await daemon.stop()
+
+
+def test_daemon_get_pid_json_format(test_paths):
+    """Test static get_pid/is_running understand the JSON PID file format."""
+    pid_file = Path(test_paths["pid_file"])
+    pid_file.parent.mkdir(parents=True, exist_ok=True)
+    pid_file.write_text(f'{{"pid": {os.getpid()}, "version": "0.0.1"}}')
+
+    assert TaskDaemon.get_pid(test_paths["pid_file"]) == os.getpid()
+    assert TaskDaemon.is_running(test_paths["pid_file"])
+
+    # Rewriting the file is picked up despite the cached PID
+    pid_file.write_text('{"pid": 12345678, "version": "0.0.1"}')
+    assert TaskDaemon.get_pid(test_paths["pid_file"]) == 12345678
+
+    pid_file.unlink()
+    assert TaskDaemon.get_pid(test_paths["pid_file"]) is None
+
+
+def test_daemon_pid_file_written_atomically(daemon, test_paths):
+    """Test PID file is written via rename and leaves no temp file behind."""
+    daemon._write_pid_file()
+
+    pid_file = Path(test_paths["pid_file"])
+    assert TaskDaemon.get_pid(test_paths["pid_file"]) == os.getpid()
+    assert not pid_file.with_suffix(pid_file.suffix + ".tmp").exists()
+
+
+@pytest.mark.anyio
+async def test_daemon_rejects_invalid_enum_params(daemon):
+    """Test unknown task_type/status values return an error response."""
+    await daemon.start()
+
+    try:
+        response = await daemon._handle_request(
+            {"action": "create_task", "params": {"name": "x", "task_type": "bogus"}}
+        )
+        assert response["status"] == "error"
+        assert "task_type" in response["error"]
+
+        response = await daemon._handle_request(
+            {"action": "list_tasks", "params": {"status": "bogus"}}
+        )
+        assert response["status"] == "error"
+        assert "status" in response["error"]
+
+        response = await daemon._handle_request(
+            {"action": "list_tasks", "params": {"status": "pending", "task_type": "agent"}}
+        )
+        assert response["status"] == "ok"
+
+    finally:
+        await daemon.stop()
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix signal delivery")
+async def test_daemon_run_stops_on_sigterm(daemon):
+    """Test SIGTERM wakes the event loop and shuts the daemon down promptly."""
+    await daemon.start()
+
+    run_task = asyncio.create_task(daemon.run())
+    await asyncio.sleep(0)
+    os.kill(os.getpid(), signal.SIGTERM)
+
+    await asyncio.wait_for(run_task, timeout=5)
+    assert not daemon._running
+    assert not Path(daemon.pid_file).exists()
+
+
+@pytest.mark.anyio
+async def test_daemon_cancel_task_returns_updated_task(daemon, tmp_path):
+    """Test cancel_task responds with the cancelled task in one call."""
+    await daemon.start()
+
+    try:
+        response = await daemon._handle_request(
+            {
+                "action": "create_task",
+                "params": {
+                    "name": "sleeper",
+                    "task_type": "process",
+                    "config": {"command": "sleep 30", "working_directory": str(tmp_path)},
+                },
+            }
+        )
+        task_id = response["data"]["task"]["task_id"]
+
+        # Wait for the process to start so cancellation goes through the executor
+        for _ in range(100):
+            task = await daemon._manager.get_task(task_id)
+            if task.pid:
+                break
+            await asyncio.sleep(0.05)
+
+        response = await daemon._handle_request(
+            {"action": "cancel_task", "params": {"task_id": task_id}}
+        )
+        assert response["status"] == "ok"
+        assert response["data"]["task"]["task_id"] == task_id
+        assert response["data"]["task"]["status"] == "cancelled"
+        assert daemon._manager.active_task_count == 0
+
+        response = await daemon._handle_request(
+            {"action": "cancel_task", "params": {"task_id": task_id}}
+        )
+        assert response["status"] == "error"
+
+    finally:
+        await daemon.stop()
+
+
+@pytest.mark.anyio
+async def test_daemon_queues_tasks_beyond_worker_pool(daemon, tmp_path):
+    """Test tasks beyond max_concurrent_tasks wait in the queue and can be cancelled there."""
+    await daemon.start()
+
+    try:
+        manager = daemon._manager
+        assert len(manager._workers) == manager.max_concurrent_tasks
+
+        params = {
+            "name": "sleeper",
+            "task_type": "process",
+            "config": {"command": "sleep 30", "working_directory": str(tmp_path)},
+        }
+        task_ids = []
+        for _ in range(manager.max_concurrent_tasks + 1):
+            response = await daemon._handle_request({"action": "create_task", "params": params})
+            task_ids.append(response["data"]["task"]["task_id"])
+
+        for _ in range(100):
+            running = [await manager.get_task(task_id) for task_id in task_ids[:-1]]
+            if all(task.pid for task in running):
+                break
+            await asyncio.sleep(0.05)
+
+        queued = await manager.get_task(task_ids[-1])
+        assert queued.status.value == "pending"
+
+        response = await daemon._handle_request(
+            {"action": "cancel_task", "params": {"task_id": task_ids[-1]}}
+        )
+        assert response["data"]["task"]["status"] == "cancelled"
+
+    finally:
+        await daemon.stop()
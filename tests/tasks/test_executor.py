@@ -0,0 +1,345 @@
+"""Tests for task executors."""
+
+import asyncio
+
+import pytest
+
+from exobrain.tasks.executor import AgentExecutor, ProcessExecutor
+from exobrain.tasks.models import Task, TaskType
+from exobrain.tasks.storage import TaskStorage
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    """Create an initialized storage."""
+    storage = TaskStorage(str(tmp_path / "tasks"))
+    await storage.initialize()
+    return storage
+
+
+@pytest.mark.anyio
+async def test_agent_output_is_buffered_until_flush(storage):
+    """Test streamed agent output is coalesced before being written."""
+    task = Task(name="Agent Task", task_type=TaskType.AGENT)
+    await storage.save_task(task)
+
+    executor = AgentExecutor(task, storage)
+    executor.OUTPUT_FLUSH_INTERVAL = 3600
+
+    await executor._buffer_output("Hello, ")
+    await executor._buffer_output("world")
+    assert await storage.read_output(task.task_id) == ""
+
+    await executor._flush_output()
+    assert await storage.read_output(task.task_id) == "Hello, world"
+
+
+@pytest.mark.anyio
+async def test_agent_output_flushes_at_size_threshold(storage):
+    """Test buffered output is written once the size threshold is reached."""
+    task = Task(name="Agent Task", task_type=TaskType.AGENT)
+    await storage.save_task(task)
+
+    executor = AgentExecutor(task, storage)
+    executor.OUTPUT_FLUSH_INTERVAL = 3600
+
+    chunk = "x" * (executor.OUTPUT_FLUSH_CHARS // 2)
+    await executor._buffer_output(chunk)
+    assert await storage.read_output(task.task_id) == ""
+
+    await executor._buffer_output(chunk)
+    assert await storage.read_output(task.task_id) == chunk * 2
+
+
+@pytest.mark.anyio
+async def test_process_output_read_in_chunks(storage, tmp_path):
+    """Test process output is captured intact across chunked reads."""
+    task = Task(
+        name="Process Task",
+        task_type=TaskType.PROCESS,
+        command="printf 'line1\\nline2\\n'; printf 'caf\\303\\251'",
+        working_directory=str(tmp_path),
+    )
+    await storage.save_task(task)
+
+    executor = ProcessExecutor(task, storage)
+    executor.READ_CHUNK_SIZE = 4
+    await executor.execute()
+
+    output = await storage.read_output(task.task_id)
+    assert output.startswith("line1\nline2\ncafé")
+    assert task.exit_code == 0
+
+
+@pytest.mark.anyio
+async def test_small_progress_updates_are_coalesced(storage):
+    """Test progress ticks below the save threshold are persisted on flush."""
+    task = Task(name="Agent Task", task_type=TaskType.AGENT)
+    await storage.save_task(task)
+
+    executor = AgentExecutor(task, storage)
+
+    await executor._update_progress(0.005)
+    assert (await storage.load_task(task.task_id)).progress == 0.0
+
+    await executor._update_progress(0.02)
+    assert (await storage.load_task(task.task_id)).progress == 0.02
+
+    await executor._update_progress(0.025)
+    assert (await storage.load_task(task.task_id)).progress == 0.02
+
+    await executor._flush_progress()
+    assert (await storage.load_task(task.task_id)).progress == 0.025
+
+
+@pytest.mark.anyio
+async def test_process_large_output_with_paused_reader(storage, tmp_path):
+    """Test large process output survives the pipe reader pausing for backpressure."""
+    task = Task(
+        name="Process Task",
+        task_type=TaskType.PROCESS,
+        command="head -c 300000 /dev/zero | tr '\\0' 'a'; echo 'stderr' >&2",
+        working_directory=str(tmp_path),
+    )
+    await storage.save_task(task)
+
+    executor = ProcessExecutor(task, storage)
+    executor.MAX_PENDING_OUTPUT = 1024
+    await executor.execute()
+
+    output = await storage.read_output(task.task_id)
+    assert output.startswith("a" * 300000 + "stderr\n")
+    assert task.exit_code == 0
+
+
+@pytest.mark.anyio
+async def test_agent_config_cached_until_files_change(tmp_path, monkeypatch):
+    """Test agent config is parsed once and reloaded when a config file changes."""
+    import exobrain.config
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("a")
+    calls = []
+
+    class FakeConfig:
+        def model_copy(self, deep=False):
+            return self
+
+    def fake_load_config():
+        calls.append(1)
+        return FakeConfig(), {}
+
+    monkeypatch.setattr(exobrain.config, "load_config", fake_load_config)
+    monkeypatch.setattr(exobrain.config, "get_user_config_path", lambda: config_file)
+    monkeypatch.setattr(AgentExecutor, "_config_cache", None)
+    monkeypatch.setattr(AgentExecutor, "_config_lock", None)
+
+    await asyncio.gather(AgentExecutor._load_config(), AgentExecutor._load_config())
+    await AgentExecutor._load_config()
+    assert len(calls) == 1
+
+    config_file.write_text("changed")
+    await AgentExecutor._load_config()
+    assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_background_flusher_writes_idle_output(storage):
+    """Test output left in the buffer is written by the background flusher."""
+    task = Task(name="Process Task", task_type=TaskType.PROCESS, command="true")
+    await storage.save_task(task)
+
+    executor = ProcessExecutor(task, storage)
+    executor.OUTPUT_FLUSH_INTERVAL = 0.01
+    executor._start_output_flusher()
+    try:
+        executor._last_output_flush = float("inf")
+        await executor._buffer_output("partial line")
+        assert await storage.read_output(task.task_id) == ""
+
+        executor._last_output_flush = 0.0
+        await asyncio.sleep(0.05)
+        assert await storage.read_output(task.task_id) == "partial line"
+    finally:
+        await executor._stop_output_flusher()
+
+
+@pytest.mark.anyio
+async def test_progress_saves_are_throttled_in_time(storage):
+    """Test progress is written at most once per interval, except on completion."""
+    task = Task(name="Agent Task", task_type=TaskType.AGENT)
+    await storage.save_task(task)
+
+    executor = AgentExecutor(task, storage)
+    executor.PROGRESS_SAVE_INTERVAL = 3600
+
+    await executor._update_progress(0.1)
+    assert (await storage.load_task(task.task_id)).progress == 0.1
+
+    await executor._update_progress(0.5)
+    assert (await storage.load_task(task.task_id)).progress == 0.1
+
+    await executor._update_progress(1.0)
+    assert (await storage.load_task(task.task_id)).progress == 1.0
+
+
+def test_format_tool_output():
+    """Test tool output is truncated only when it exceeds the limits."""
+    from exobrain.agent.base import ToolOutputChunk
+
+    short = ToolOutputChunk("shell", "line 1\nline 2")
+    assert short == "\n\n[Tool: shell]\nline 1\nline 2\n"
+    assert AgentExecutor._format_tool_output(short) == short
+
+    long_output = "\n".join(f"line {i}" for i in range(100))
+    formatted = AgentExecutor._format_tool_output(
+        ToolOutputChunk("shell", long_output), max_lines=10, max_chars=10000
+    )
+    assert formatted.startswith("\n\n[Tool: shell]\nline 0\n")
+    assert "line 9\n" in formatted
+    assert "line 10\n" not in formatted
+    assert formatted.endswith("\n[Content truncated: 90 more lines. Total 100 lines.]\n")
+
+    formatted = AgentExecutor._format_tool_output(
+        ToolOutputChunk("shell", "x" * 50), max_lines=10, max_chars=20
+    )
+    assert (
+        formatted == "\n\n[Tool: shell]\n" + "x" * 20 + "\n[Content truncated at 20 characters.]\n"
+    )
+
+
+@pytest.mark.anyio
+async def test_iteration_handler_runs_inline(storage):
+    """Test iteration events update the task in memory and only await throttled saves."""
+    from exobrain.agent.events import EventManager, EventType, IterationStartedEvent
+
+    task = Task(name="Agent Task", task_type=TaskType.AGENT)
+    await storage.save_task(task)
+
+    executor = AgentExecutor(task, storage)
+    executor.PROGRESS_SAVE_INTERVAL = 3600
+    events = EventManager()
+    events.register(executor._on_iteration_started, EventType.ITERATION_STARTED)
+
+    await events.emit(IterationStartedEvent(iteration=1, max_iterations=10))
+    assert (await storage.load_task(task.task_id)).progress == 0.1
+
+    assert (
+        executor._on_iteration_started(IterationStartedEvent(iteration=2, max_iterations=10))
+        is None
+    )
+    assert task.iterations == 2
+    assert task.progress == 0.2
+    assert (await storage.load_task(task.task_id)).progress == 0.1
+
+    await executor._flush_progress()
+    assert (await storage.load_task(task.task_id)).progress == 0.2
+
+
+def test_agent_pool_resets_and_reuses_agents(monkeypatch):
+    """Test released agents are reset, pooled per key and capped in number."""
+    from exobrain.agent.events import EventManager, EventType
+
+    class FakeAgent:
+        def __init__(self):
+            self.events = EventManager()
+            self.history = ["message"]
+            self.runtime_permissions = {"shell": True}
+
+        def clear_history(self):
+            self.history = []
+
+    monkeypatch.setattr(AgentExecutor, "_agent_pool", {})
+    monkeypatch.setattr(AgentExecutor, "AGENT_POOL_SIZE", 1)
+
+    assert AgentExecutor._acquire_agent(("sig", None, None)) is None
+
+    agent = FakeAgent()
+    agent.events.register(lambda event: None, EventType.ITERATION_STARTED)
+    AgentExecutor._release_agent(("sig", None, None), agent)
+    AgentExecutor._release_agent(("sig", None, None), FakeAgent())
+
+    assert AgentExecutor._acquire_agent(("sig", "other-model", None)) is None
+    reused = AgentExecutor._acquire_agent(("sig", None, None))
+    assert reused is agent
+    assert agent.history == []
+    assert agent.runtime_permissions == {}
+    assert agent.events.get_callback_count() == 0
+    assert AgentExecutor._acquire_agent(("sig", None, None)) is None
+
+
+@pytest.mark.anyio
+async def test_agent_task_allows_exobrain_working_directory(storage, tmp_path, monkeypatch):
+    """Test a working directory with .exobrain is added to shell allowed directories."""
+    import exobrain.cli.util
+    from exobrain.agent.events import EventManager
+    from exobrain.config import PermissionsConfig
+
+    (tmp_path / ".exobrain").mkdir()
+    seen = []
+
+    class FakeConfig:
+        def __init__(self):
+            self.permissions = PermissionsConfig()
+
+        def model_copy(self, deep=False):
+            return FakeConfig()
+
+    class FakeAgent:
+        def __init__(self):
+            self.events = EventManager()
+            self.runtime_permissions = {}
+
+        async def process_message(self, prompt):
+            return "done"
+
+        def clear_history(self):
+            pass
+
+    def fake_create_agent(config, model_spec=None):
+        seen.append(config.permissions.shell_execution["allowed_directories"])
+        return FakeAgent(), None
+
+    monkeypatch.setattr(AgentExecutor, "_config_cache", ((), FakeConfig()))
+    monkeypatch.setattr(AgentExecutor, "_config_signature", staticmethod(lambda: ()))
+    monkeypatch.setattr(AgentExecutor, "_agent_pool", {})
+    monkeypatch.setattr(exobrain.cli.util, "create_agent_from_config", fake_create_agent)
+
+    task = Task(
+        name="Agent Task",
+        task_type=TaskType.AGENT,
+        config={"working_directory": str(tmp_path)},
+    )
+    await storage.save_task(task)
+    await AgentExecutor(task, storage).execute()
+
+    assert seen == [[str(tmp_path)]]
+    assert await storage.read_output(task.task_id) == "done"
+
+
+@pytest.mark.anyio
+async def test_process_killed_when_terminate_times_out(storage, tmp_path):
+    """Test cancel kills a process that ignores SIGTERM once the timeout passes."""
+    task = Task(
+        name="Process Task",
+        task_type=TaskType.PROCESS,
+        command="trap '' TERM; exec sleep 30",
+        working_directory=str(tmp_path),
+    )
+    await storage.save_task(task)
+
+    executor = ProcessExecutor(task, storage)
+    executor.TERMINATE_TIMEOUT = 0.1
+    run = asyncio.create_task(executor.execute())
+    for _ in range(100):
+        if task.pid:
+            break
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(0.1)
+
+    await asyncio.wait_for(executor.cancel(), timeout=5)
+    assert executor._process.returncode is not None
+
+    with pytest.raises(RuntimeError, match="-9"):
+        await asyncio.wait_for(run, timeout=5)
+    assert "--- Process cancelled ---" in await storage.read_output(task.task_id)
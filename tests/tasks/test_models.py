@@ -58,3 +58,16 @@ def test_task_duration():
     task.started_at = datetime.now()
     assert task.duration is not None
     assert task.duration >= 0
+
+
+def test_task_to_dict_tracks_datetime_changes():
+    """Test cached datetime strings follow field reassignment."""
+    task = Task(name="Test", task_type=TaskType.AGENT)
+    assert task.to_dict()["started_at"] is None
+
+    task.started_at = datetime(2026, 1, 1, 12, 0, 0)
+    assert task.to_dict()["started_at"] == "2026-01-01T12:00:00"
+
+    task.started_at = datetime(2026, 1, 2, 12, 0, 0)
+    assert task.to_dict()["started_at"] == "2026-01-02T12:00:00"
+    assert task.to_dict()["created_at"] == task.created_at.isoformat()
@@ -1,11 +1,16 @@
 """Tests for task storage."""
 
+import asyncio
 import shutil
 import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
 
 import pytest
 
-from exobrain.tasks.models import Task, TaskType
+from exobrain.tasks import storage as storage_module
+from exobrain.tasks.models import Task, TaskStatus, TaskType
 from exobrain.tasks.storage import TaskStorage
 
 
@@ -82,6 +87,27 @@ async def test_delete_task():
         shutil.rmtree(temp_dir)
 
 
+@pytest.mark.anyio
+async def test_delete_task_removes_directory():
+    """Test task directories are removed, including unexpected leftover files."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+
+        tasks = [Task(name=f"Task {i}") for i in range(2)]
+        for task in tasks:
+            await storage.save_task(task)
+            await storage.append_output(task.task_id, "output")
+        (storage._get_task_dir(tasks[1].task_id) / "metadata.json.tmp").write_text("")
+
+        for task in tasks:
+            assert await storage.delete_task(task.task_id)
+            assert not storage._get_task_dir(task.task_id).exists()
+    finally:
+        shutil.rmtree(temp_dir)
+
+
 @pytest.mark.anyio
 async def test_output_operations():
     """Test output append and read."""
@@ -101,3 +127,436 @@ async def test_output_operations():
         assert "Line 2" in output
     finally:
         shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_iter_tasks():
+    """Test lazily iterating tasks with filters and limit."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+
+        for i in range(3):
+            await storage.save_task(Task(name=f"Agent {i}", task_type=TaskType.AGENT))
+        await storage.save_task(Task(name="Process", task_type=TaskType.PROCESS))
+
+        tasks = [task async for task in storage.iter_tasks(task_type="agent")]
+        assert len(tasks) == 3
+        assert all(task.task_type == TaskType.AGENT for task in tasks)
+
+        tasks = [task async for task in storage.iter_tasks(limit=2)]
+        assert len(tasks) == 2
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_task_counts_follow_saves_and_deletes():
+    """Test running counts track status transitions, durations and deletions."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+
+        started = datetime.now() - timedelta(minutes=10)
+        short = Task(name="Short", task_type=TaskType.AGENT, started_at=started)
+        long = Task(name="Long", task_type=TaskType.PROCESS, started_at=started)
+        await storage.save_task(short)
+        await storage.save_task(long)
+
+        counts = await storage.get_task_counts()
+        assert counts.status["pending"] == 2
+        assert counts.duration_count == 0
+
+        short.status = TaskStatus.COMPLETED
+        short.completed_at = started + timedelta(seconds=10)
+        long.status = TaskStatus.FAILED
+        long.completed_at = started + timedelta(seconds=30)
+        await storage.save_task(short)
+        await storage.save_task(long)
+
+        counts = await storage.get_task_counts()
+        assert counts.status["pending"] == 0
+        assert counts.status["completed"] == 1
+        assert counts.status["failed"] == 1
+        assert counts.task_type["process"] == 1
+        assert counts.duration_sum == 40
+        assert (counts.duration_min, counts.duration_max) == (10, 30)
+
+        await storage.delete_task(short.task_id)
+        counts = await storage.get_task_counts()
+        assert counts.status["completed"] == 0
+        assert counts.duration_count == 1
+        assert (counts.duration_min, counts.duration_max) == (30, 30)
+
+        # A fresh storage rebuilds the same counts from the index
+        await storage.flush()
+        counts = await TaskStorage(temp_dir).get_task_counts()
+        assert counts.status["failed"] == 1
+        assert counts.duration_sum == 30
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_count_recent_follows_status_changes():
+    """Test recent activity counts track creations, completions and deletions."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+        now = datetime.now()
+        hour_ago = now - timedelta(hours=1)
+
+        old = Task(
+            name="Old",
+            status=TaskStatus.COMPLETED,
+            created_at=now - timedelta(hours=3),
+            completed_at=now - timedelta(hours=2),
+        )
+        late = Task(
+            name="Late",
+            status=TaskStatus.FAILED,
+            created_at=now - timedelta(hours=3),
+            completed_at=now - timedelta(minutes=5),
+        )
+        recent = Task(name="Recent", created_at=now - timedelta(minutes=10))
+        for task in (old, late, recent):
+            await storage.save_task(task)
+        assert await storage.count_recent(hour_ago) == (1, 0, 1)
+
+        recent.status = TaskStatus.COMPLETED
+        recent.completed_at = now
+        await storage.save_task(recent)
+        assert await storage.count_recent(hour_ago) == (1, 1, 1)
+
+        await storage.delete_task(late.task_id)
+        assert await storage.count_recent(hour_ago) == (1, 1, 0)
+
+        await storage.flush()
+        reloaded = TaskStorage(temp_dir)
+        assert await reloaded.count_recent(hour_ago) == (1, 1, 0)
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_list_running_started_before():
+    """Test running tasks are found by start time and leave once they finish."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+        now = datetime.now()
+
+        tasks = [
+            Task(
+                name=f"Task {hours}h",
+                status=TaskStatus.RUNNING,
+                started_at=now - timedelta(hours=hours),
+            )
+            for hours in (1, 30, 48)
+        ]
+        for task in tasks:
+            await storage.save_task(task)
+
+        stuck = await storage.list_running_started_before(now - timedelta(hours=24))
+        assert [info["task_id"] for info in stuck] == [tasks[2].task_id, tasks[1].task_id]
+
+        # Returned entries are copies, so changing them leaves the index alone
+        stuck[0]["status"] = TaskStatus.FAILED.value
+        assert (await storage._read_index())[tasks[2].task_id]["status"] == "running"
+
+        tasks[2].status = TaskStatus.COMPLETED
+        tasks[2].completed_at = now
+        await storage.save_task(tasks[2])
+        await storage.delete_task(tasks[1].task_id)
+        assert await storage.list_running_started_before(now - timedelta(hours=24)) == []
+        assert len(await storage.list_running_started_before(now)) == 1
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_task_counts_migrate_old_index_entries():
+    """Test index entries without durations are filled in from task metadata."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+
+        task = Task(
+            name="Old",
+            status=TaskStatus.COMPLETED,
+            started_at=datetime.now() - timedelta(seconds=20),
+            completed_at=datetime.now(),
+        )
+        await storage.save_task(task)
+
+        index = await storage._read_index()
+        for key in ("started_at", "completed_at", "duration"):
+            del index[task.task_id][key]
+        await storage._write_index(index)
+        await storage.flush()
+
+        storage = TaskStorage(temp_dir)
+        counts = await storage.get_task_counts()
+        assert counts.duration_count == 1
+        index = await storage._read_index()
+        assert index[task.task_id]["started_at"] == task.started_at.isoformat()
+        assert await storage.count_recent(datetime.now() - timedelta(hours=1)) == (1, 1, 0)
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_index_writes_are_coalesced():
+    """Test index changes are kept in memory and flushed to disk together."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        storage.INDEX_FLUSH_DELAY = 3600
+        await storage.initialize()
+
+        tasks = [Task(name=f"Task {i}") for i in range(3)]
+        for task in tasks:
+            await storage.save_task(task)
+        assert len(await storage.list_tasks()) == 3
+        assert storage.index_file.read_bytes() == b"{}"
+
+        await storage.flush()
+        reloaded = TaskStorage(temp_dir)
+        assert {task.task_id for task in await reloaded.list_tasks()} == {
+            task.task_id for task in tasks
+        }
+        assert not list(reloaded.storage_path.glob("*.tmp"))
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_index_written_through_on_status_transitions():
+    """Test running and finished tasks reach the on-disk index without waiting for a flush."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        storage.INDEX_FLUSH_DELAY = 3600
+        await storage.initialize()
+
+        task = Task(name="Durable")
+        await storage.save_task(task)
+        assert storage.index_file.read_bytes() == b"{}"
+
+        task.status = TaskStatus.RUNNING
+        task.started_at = datetime.now()
+        await storage.save_task(task)
+        reloaded = TaskStorage(temp_dir)
+        assert [t.status for t in await reloaded.list_tasks()] == [TaskStatus.RUNNING]
+
+        task.status = TaskStatus.COMPLETED
+        task.completed_at = datetime.now()
+        await storage.save_task(task)
+        reloaded = TaskStorage(temp_dir)
+        assert [t.status for t in await reloaded.list_tasks()] == [TaskStatus.COMPLETED]
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_append_and_read_events():
+    """Test events round-trip and limit returns the most recent ones."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+
+        assert await storage.read_events("missing") == []
+
+        for i in range(5):
+            await storage.append_event("task", {"type": "tick", "n": i})
+
+        events = await storage.read_events("task")
+        assert [event["n"] for event in events] == [0, 1, 2, 3, 4]
+        assert all("timestamp" in event for event in events)
+
+        events = await storage.read_events("task", limit=2)
+        assert [event["n"] for event in events] == [3, 4]
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_read_events_tail_with_large_events():
+    """Test limited reads widen the tail window for events larger than expected."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+
+        payload = "x" * (storage.EVENT_TAIL_LINE_SIZE * 3)
+        for i in range(10):
+            await storage.append_event("task", {"n": i, "payload": payload})
+
+        events = await storage.read_events("task", limit=3)
+        assert [event["n"] for event in events] == [7, 8, 9]
+
+        events = await storage.read_events("task", limit=50)
+        assert [event["n"] for event in events] == list(range(10))
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_events_are_buffered_until_flushed():
+    """Test events reach disk after the flush delay or when the task finishes."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+
+        task = Task(name="Chatty")
+        await storage.save_task(task)
+        events_file = storage._get_events_file(task.task_id)
+
+        for i in range(3):
+            await storage.append_event(task.task_id, {"n": i})
+        assert not events_file.exists()
+
+        await asyncio.sleep(storage.EVENT_FLUSH_DELAY * 3)
+        assert len(events_file.read_bytes().splitlines()) == 3
+
+        await storage.append_event(task.task_id, {"n": 3})
+        task.status = TaskStatus.COMPLETED
+        await storage.save_task(task)
+        assert len(events_file.read_bytes().splitlines()) == 4
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_list_tasks_follows_status_changes():
+    """Test status and type filters see status transitions and deletions."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+
+        agent = Task(name="Agent", task_type=TaskType.AGENT)
+        process = Task(name="Process", task_type=TaskType.PROCESS)
+        await storage.save_task(agent)
+        await storage.save_task(process)
+
+        agent.status = TaskStatus.RUNNING
+        await storage.save_task(agent)
+
+        pending = await storage.list_tasks(status=TaskStatus.PENDING)
+        assert [task.task_id for task in pending] == [process.task_id]
+        running = await storage.list_tasks(status=TaskStatus.RUNNING, task_type="agent")
+        assert [task.task_id for task in running] == [agent.task_id]
+        assert await storage.list_tasks(status=TaskStatus.RUNNING, task_type="process") == []
+
+        await storage.delete_task(agent.task_id)
+        assert await storage.list_tasks(status=TaskStatus.RUNNING) == []
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_list_tasks_newest_first():
+    """Test listings are newest first, including tasks saved out of creation order."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+
+        now = datetime.now()
+        tasks = [
+            Task(name=f"Task {i}", task_type=TaskType.AGENT, created_at=now - timedelta(minutes=i))
+            for i in range(4)
+        ]
+        for task in (tasks[2], tasks[0], tasks[3], tasks[1]):
+            await storage.save_task(task)
+
+        listed = await storage.list_tasks()
+        assert [task.name for task in listed] == ["Task 0", "Task 1", "Task 2", "Task 3"]
+
+        listed = await storage.list_tasks(limit=2)
+        assert [task.name for task in listed] == ["Task 0", "Task 1"]
+
+        listed = await storage.list_tasks(status=TaskStatus.PENDING, limit=3)
+        assert [task.name for task in listed] == ["Task 0", "Task 1", "Task 2"]
+
+        await storage.delete_task(tasks[1].task_id)
+        listed = await storage.list_tasks(limit=2)
+        assert [task.name for task in listed] == ["Task 0", "Task 2"]
+
+        await storage.flush()
+        listed = await TaskStorage(temp_dir).list_tasks()
+        assert [task.name for task in listed] == ["Task 0", "Task 2", "Task 3"]
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_concurrent_writes_keep_call_order():
+    """Test off-loop writes of one task land in the order they were made."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+
+        task = Task(name="Task")
+        saves = []
+        for i in range(1, 21):
+            snapshot = Task.from_dict(task.to_dict())
+            snapshot.progress = i / 20
+            saves.append(storage.save_task(snapshot))
+        appends = [storage.append_output(task.task_id, f"{i}\n") for i in range(20)]
+        await asyncio.gather(*saves, *appends)
+
+        assert (await storage.load_task(task.task_id)).progress == 1.0
+        output = await storage.read_output(task.task_id)
+        assert output == "".join(f"{i}\n" for i in range(20))
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.anyio
+async def test_cancelled_save_finishes_before_next_write(monkeypatch):
+    """Test a save cancelled mid-write holds the task lock until its thread is done."""
+    active = 0
+    overlapped = False
+    counter_lock = threading.Lock()
+    replace_file = storage_module._replace_file
+
+    def slow_replace_file(path, data):
+        nonlocal active, overlapped
+        with counter_lock:
+            active += 1
+            overlapped = overlapped or active > 1
+        time.sleep(0.05)
+        replace_file(path, data)
+        with counter_lock:
+            active -= 1
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        storage = TaskStorage(temp_dir)
+        await storage.initialize()
+        monkeypatch.setattr(storage_module, "_replace_file", slow_replace_file)
+
+        task = Task(name="Task")
+        save = asyncio.ensure_future(storage.save_task(task))
+        await asyncio.sleep(0.01)
+        save.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await save
+
+        task.status = TaskStatus.CANCELLED
+        await storage.save_task(task)
+
+        assert not overlapped
+        assert (await storage.load_task(task.task_id)).status == TaskStatus.CANCELLED
+    finally:
+        shutil.rmtree(temp_dir)
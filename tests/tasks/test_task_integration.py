@@ -271,3 +271,16 @@ async def test_multiple_clients(running_daemon, test_paths):
             # Retrieve with client2
             retrieved = await client2.get_task(task.task_id)
             assert retrieved.task_id == task.task_id
+
+
+@pytest.mark.anyio
+async def test_get_tasks_batch(running_daemon, client):
+    """Test fetching several tasks in one batch request."""
+    async with client:
+        task1 = await client.create_task(name="Task 1", task_type=TaskType.AGENT)
+        task2 = await client.create_task(name="Task 2", task_type=TaskType.AGENT)
+
+        tasks = await client.get_tasks([task2.task_id, task1.task_id])
+        assert [t.task_id for t in tasks] == [task2.task_id, task1.task_id]
+
+        assert await client.batch([]) == []
@@ -247,6 +247,23 @@ async def test_monitor_check_health_high_failure_rate(storage, monitor):
     assert any("High failure rate" in w for w in health.warnings)
 
 
+@pytest.mark.anyio
+async def test_monitor_check_health_reuses_recent_metrics(monitor):
+    """Test health checks reuse a recent snapshot or the metrics they are given."""
+    await monitor.check_health(active_task_count=1)
+    await monitor.check_health(active_task_count=1)
+    assert len(monitor.get_metrics_history()) == 1
+
+    # A different active count needs a fresh snapshot
+    await monitor.check_health(active_task_count=2)
+    assert len(monitor.get_metrics_history()) == 2
+
+    metrics = TaskMetrics(total_tasks=20, failure_rate=0.9)
+    health = await monitor.check_health(metrics=metrics)
+    assert any("High failure rate" in w for w in health.warnings)
+    assert len(monitor.get_metrics_history()) == 2
+
+
 @pytest.mark.anyio
 async def test_monitor_get_task_statistics(storage, monitor):
     """Test getting detailed task statistics."""
@@ -369,6 +386,18 @@ async def test_monitor_metrics_history_limit(monitor):
     assert len(history) == 3
 
 
+@pytest.mark.anyio
+async def test_monitor_metrics_history_is_bounded(monitor):
+    """Test metrics history keeps only the most recent entries."""
+    collected = [await monitor.collect_metrics() for _ in range(monitor._max_history_size + 5)]
+
+    history = monitor.get_metrics_history()
+    assert len(history) == monitor._max_history_size
+    assert history[0] is collected[5]
+    assert history[-1] is collected[-1]
+    assert monitor.get_metrics_history(limit=2) == collected[-2:]
+
+
 # ============================================================================
 # Auto-Cleanup Tests
 # ============================================================================
@@ -1,7 +1,13 @@
 """Tests for transport layer."""
 
+import asyncio
+import subprocess
+import sys
 
-from exobrain.tasks.transport import TransportFactory, TransportType
+import pytest
+
+from exobrain.tasks.transport import TransportFactory, TransportType, factory
+from exobrain.tasks.transport.base import LENGTH_PREFIX
 
 
 def test_platform_detection():
@@ -10,6 +16,24 @@ def test_platform_detection():
     assert detected in [TransportType.UNIX, TransportType.PIPE, TransportType.HTTP]
 
 
+@pytest.mark.parametrize(
+    "platform, expected",
+    [
+        ("linux", TransportType.UNIX),
+        ("darwin", TransportType.UNIX),
+        ("win32", TransportType.PIPE),
+        ("freebsd14", TransportType.HTTP),
+    ],
+)
+def test_platform_detection_by_sys_platform(monkeypatch, platform, expected):
+    """Test each platform maps to its transport."""
+    monkeypatch.setattr(sys, "platform", platform)
+    assert TransportFactory.detect_platform_transport() == expected
+    assert TransportFactory.is_transport_available(TransportType.UNIX) == (
+        expected == TransportType.UNIX
+    )
+
+
 def test_transport_availability():
     """Test transport availability checks."""
     # Unix should be available on Linux/macOS
@@ -35,3 +59,73 @@ def test_get_default_config():
     config = TransportFactory.get_default_config(TransportType.UNIX)
     assert isinstance(config, dict)
     assert "socket_path" in config
+
+    # Callers get their own copy
+    config["socket_path"] = "/tmp/other.sock"
+    assert TransportFactory.get_default_config(TransportType.UNIX)["socket_path"] != (
+        "/tmp/other.sock"
+    )
+
+
+def test_http_transport_imported_lazily():
+    """Test the HTTP transport module is not loaded by other transports."""
+    code = (
+        "import sys\n"
+        "from exobrain.tasks.transport import TransportFactory, TransportType\n"
+        "TransportFactory.create_transport(TransportType.UNIX, {'socket_path': '/tmp/x.sock'})\n"
+        "TransportFactory.is_transport_available(TransportType.HTTP)\n"
+        "assert 'exobrain.tasks.transport.http' not in sys.modules\n"
+        "assert 'aiohttp' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_factory_functions_match_facade():
+    """Test module-level factory functions and TransportFactory are interchangeable."""
+    assert TransportFactory.create_transport is factory.create_transport
+    assert factory.get_default_config(TransportType.UNIX) == TransportFactory.get_default_config(
+        TransportType.UNIX
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.platform == "win32", reason="Proactor loop supports named pipes")
+async def test_named_pipe_requires_proactor_loop():
+    """Test named pipes fail clearly on event loops without pipe support."""
+    transport = TransportFactory.create_transport(TransportType.PIPE, {"pipe_name": "x"})
+    with pytest.raises(RuntimeError, match="Proactor"):
+        await transport.connect()
+    assert not transport.is_connected()
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets are not available")
+async def test_unix_server_logs_client_errors(tmp_path, caplog):
+    """Test errors while serving a client are logged and close the connection."""
+    socket_path = str(tmp_path / "daemon.sock")
+    server = TransportFactory.create_server(TransportType.UNIX, {"socket_path": socket_path})
+    await server.start()
+    try:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        payload = b"not json"
+        writer.write(LENGTH_PREFIX.pack(len(payload)) + payload)
+        await writer.drain()
+        assert await reader.read() == b""
+        writer.close()
+        await writer.wait_closed()
+    finally:
+        await server.stop()
+
+    assert "Error handling client" in caplog.text
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets are not available")
+async def test_unix_transport_missing_socket(tmp_path):
+    """Test connecting to a missing socket file raises ConnectionError."""
+    transport = TransportFactory.create_transport(
+        TransportType.UNIX, {"socket_path": str(tmp_path / "missing.sock")}
+    )
+    with pytest.raises(ConnectionError, match="Socket file not found"):
+        await transport.connect()
+    assert not transport.is_connected()